@@ -1,83 +1,192 @@
 #!/usr/bin/env python3
 """Check markdown files for bare code blocks (no language specifier).
 
-Usage: check-markdown-codeblocks.py <file>
+Usage: check-markdown-codeblocks.py <file> [<file> ...]
+
+Non-markdown and missing files are skipped, so a whole changed-file list
+can be passed in one call.
 
 Tracks open/close state to distinguish opening fences from closing fences.
 Only opening fences without a language specifier are flagged.
 
 Exit codes:
-  0 — All code blocks have language specifiers (or file is not markdown)
-  1 — Found bare code blocks without language specifiers
+  0 — All code blocks have language specifiers (or no file is markdown)
+  1 — Found bare code blocks without language specifiers in any file
   2 — Invalid arguments
 """
 
-import sys
+import mmap
 import os
+import stat
+import sys
+
+# Line breaks as indexing a mapping yields them (ints). Lone \r counts as a
+# break too, matching the universal-newline line splitting of text mode.
+LF = ord("\n")
+CR = ord("\r")
+
+# Line numbers listed per file; past this only the total is reported.
+MAX_REPORTED = 100
+
+
+def _is_blank(chunk):
+    """True if the bytes decode to nothing but whitespace, as str.strip() sees it.
+
+    Decoding (rather than bytes.strip()) keeps Unicode whitespace such as NBSP
+    and the \f/\v controls counting as whitespace.
+    """
+    return not chunk.decode("utf-8", "replace").strip()
+
+
+def _line_start(data, pos):
+    """Index just past the last line break (\n or \r) before pos."""
+    start = data.rfind(b"\n", 0, pos) + 1
+    # The \r search is bounded by the last \n, so it never rescans the file
+    return max(start, data.rfind(b"\r", start, pos) + 1)
 
 
-def check_file(filepath):
+def _line_end(data, pos):
+    """Index of the first line break (\n or \r) at or after pos, or len(data)."""
+    end = data.find(b"\n", pos)
+    if end == -1:
+        end = len(data)
+    cr = data.find(b"\r", pos, end)
+    return end if cr == -1 else cr
+
+
+def _count_lines(chunk):
+    """Number of line breaks in chunk, counting \r\n once."""
+    return chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+
+
+def _find_bare_fences(data, cap):
+    """Return (line numbers, total) of opening fences without a language specifier.
+
+    At most cap line numbers are collected; the total counts every one.
+    """
+    pos = data.find(b"```")
+    if pos == -1:
+        # No backtick run anywhere — one search proves there is nothing to do
+        return [], 0
+
     violations = []
+    total = 0
     inside_code_block = False
-    line_number = 0
 
+    # Line numbers are only needed for violations, so line breaks are counted
+    # lazily from the previous violation rather than tracked on every line.
+    line_number = 1
+    counted_to = 0
+
+    # Jump from one ``` to the next with find() (a C-level memory search) and
+    # only look at the surrounding line for those candidates. Prose lines are
+    # never visited individually.
+    while pos != -1:
+        line_end = _line_end(data, pos)
+        if pos == 0 or data[pos - 1] in (LF, CR):
+            # Flush-left fence, the usual shape: the line starts at the
+            # backticks, so there is no indentation to look at
+            line_start = pos
+        else:
+            line_start = _line_start(data, pos)
+            if not _is_blank(data[line_start:pos]):
+                # Backticks mid-line (inline code, prose) — not a fence.
+                # Only the first ``` on a line can follow nothing but
+                # indentation, so the rest of the line is skipped.
+                pos = data.find(b"```", line_end)
+                continue
+
+        # Fences alternate opening/closing; only an opening fence needs a
+        # language specifier, so flip the state instead of branching on it.
+        is_opening = not inside_code_block
+        inside_code_block ^= True
+        if is_opening and _is_blank(data[pos + 3:line_end]):
+            total += 1
+            # Past the cap the scan only keeps state and counts, so the
+            # line counting and list growth stop as well
+            if total <= cap:
+                line_number += _count_lines(data[counted_to:line_start])
+                counted_to = line_start
+                violations.append(line_number)
+        pos = data.find(b"```", line_end)
+
+    return violations, total
+
+
+def check_file(filepath, cap=MAX_REPORTED):
+    """Return (first cap violation line numbers, total violations) for a file."""
+    # Opening is the existence check (no separate stat). O_NONBLOCK keeps a
+    # FIFO named *.md from blocking the open; it is ignored for regular files.
     try:
-        f = open(filepath, "r", encoding="utf-8", errors="replace")
+        fd = os.open(filepath, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
     except OSError:
-        return violations
-
-    with f:
-        for line in f:
-            line_number += 1
-            stripped = line.strip()
-
-            # Check for fence lines (``` optionally followed by language)
-            # strip() handles up to 3 spaces of indentation per CommonMark spec
-            if stripped.startswith("```"):
-                if not inside_code_block:
-                    # Opening fence — check for language specifier
-                    after_fence = stripped[3:].strip()
-                    if not after_fence:
-                        violations.append(line_number)
-                    inside_code_block = True
-                else:
-                    # Closing fence
-                    inside_code_block = False
+        return [], 0
 
-    return violations
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            # Directories, FIFOs, devices — nothing to check
+            return [], 0
+        size = st.st_size
+        if size < 3:
+            # Too small to hold a fence (and empty files cannot be mapped)
+            return [], 0
+        # Map the file rather than reading it: pages fault in on demand and
+        # the scan runs over the mapping without copying it into Python.
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as data:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                # The scan is one front-to-back pass: ask for aggressive
+                # readahead up front (constants are absent where the
+                # platform has no madvise)
+                data.madvise(mmap.MADV_SEQUENTIAL)
+                data.madvise(mmap.MADV_WILLNEED)
+            return _find_bare_fences(data, cap)
+    except OSError:
+        # Not mappable — nothing to check
+        return [], 0
+    finally:
+        os.close(fd)
+
+
+def report(filepath, violations, count):
+    """Return the report for one file as a single string."""
+    lines = [f"Found {count} bare code block{'s' if count > 1 else ''} (no language specifier) in {filepath}:"]
+    lines.extend(f"  Line {ln}" for ln in violations)
+    if count > len(violations):
+        lines.append(f"  ... showing first {len(violations)} of {count}")
+    lines.append("")
+    lines.append("Add a language specifier (e.g., bash, json, text) after the opening triple backticks.")
+    if count > 1:
+        lines.append(f"Fix ALL {count} code blocks in a single edit to avoid repeated hook violations.")
+        lines.append("Some may be pre-existing in the file, not from your current change. Fix them anyway.")
+    return "\n".join(lines) + "\n"
 
 
 def main():
     if len(sys.argv) < 2:
-        print("ERROR: Usage: check-markdown-codeblocks.py <file>", file=sys.stderr)
+        print("ERROR: Usage: check-markdown-codeblocks.py <file> [<file> ...]", file=sys.stderr)
         sys.exit(2)
 
-    filepath = sys.argv[1]
-
-    # Only check markdown files
-    ext = os.path.splitext(filepath)[1].lower()
-    if ext not in (".md", ".mdx", ".markdown"):
-        sys.exit(0)
-
-    # Skip files that don't exist (e.g., deleted before hook ran)
-    if not os.path.isfile(filepath):
-        sys.exit(0)
-
-    violations = check_file(filepath)
-
-    if violations:
-        count = len(violations)
-        print(f"Found {count} bare code block{'s' if count > 1 else ''} (no language specifier) in {filepath}:")
-        for ln in violations:
-            print(f"  Line {ln}")
-        print()
-        print("Add a language specifier (e.g., bash, json, text) after the opening triple backticks.")
-        if count > 1:
-            print(f"Fix ALL {count} code blocks in a single edit to avoid repeated hook violations.")
-            print("Some may be pre-existing in the file, not from your current change. Fix them anyway.")
-        sys.exit(1)
-    else:
-        sys.exit(0)
+    # Check every file in one process so callers with many files pay
+    # interpreter startup once rather than per file
+    reports = []
+    for filepath in sys.argv[1:]:
+        # Only check markdown files
+        ext = os.path.splitext(filepath)[1].lower()
+        if ext not in (".md", ".mdx", ".markdown"):
+            continue
+
+        # Files that don't exist (e.g., deleted before hook ran) or aren't
+        # regular files come back from check_file with nothing to report
+        violations, count = check_file(filepath)
+        if count:
+            reports.append(report(filepath, violations, count))
+
+    # One write for everything, separated by blank lines, instead of a
+    # print() per line
+    if reports:
+        sys.stdout.write("\n".join(reports))
+    sys.exit(1 if reports else 0)
 
 
 if __name__ == "__main__":
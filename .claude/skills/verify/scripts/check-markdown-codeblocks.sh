@@ -1,14 +1,14 @@
 #!/usr/bin/env bash
 # check-markdown-codeblocks.sh — Check markdown files for bare code blocks
 #
-# Usage: check-markdown-codeblocks.sh <file>
+# Usage: check-markdown-codeblocks.sh <file> [<file> ...]
 #
 # Thin wrapper around check-markdown-codeblocks.py.
 # Delegates to the Python script in the same directory.
 #
 # Exit codes:
-#   0 — All code blocks have language specifiers (or file is not markdown)
-#   1 — Found bare code blocks without language specifiers
+#   0 — All code blocks have language specifiers (or no file is markdown)
+#   1 — Found bare code blocks without language specifiers in any file
 #   2 — Invalid arguments
 
 set -uo pipefail
@@ -145,17 +145,24 @@ if [ "$HAS_GOMOD" = true ]; then
   fi
 
 elif [ "$HAS_PACKAGE_JSON" = true ]; then
-  # Read package.json scripts using python3 (available on macOS)
-  SCRIPTS_JSON=$(DETECT_PKG_PATH="$PROJECT_DIR/package.json" python3 -c "
-import json, sys, os
+  # Read which of the scripts we look for package.json defines, using one
+  # python3 call (available on macOS) that prints one name per line
+  SCRIPT_NAMES=$(DETECT_PKG_PATH="$PROJECT_DIR/package.json" python3 -c "
+import json, os
 try:
     with open(os.environ['DETECT_PKG_PATH']) as f:
         pkg = json.load(f)
     scripts = pkg.get('scripts', {})
-    print(json.dumps(scripts))
+    for name in ('build', 'typecheck', 'type-check', 'lint', 'test'):
+        if name in scripts:
+            print(name)
 except Exception:
-    print('{}')
-" 2>/dev/null || echo '{}')
+    pass
+" 2>/dev/null || echo '')
+
+  has_script() {
+    [[ $'\n'"$SCRIPT_NAMES"$'\n' == *$'\n'"$1"$'\n'* ]]
+  }
 
   # Detect package manager
   PKG_MANAGER="npm"
@@ -168,30 +175,30 @@ except Exception:
   fi
 
   # Detect build command
-  if echo "$SCRIPTS_JSON" | python3 -c "import json,sys; sys.exit(0 if 'build' in json.load(sys.stdin) else 1)" 2>/dev/null; then
+  if has_script build; then
     CMD_BUILD="$PKG_MANAGER run build"
   elif [ "$HAS_TSCONFIG" = true ]; then
     CMD_BUILD="npx tsc --noEmit"
   fi
 
   # Detect typecheck command
-  if echo "$SCRIPTS_JSON" | python3 -c "import json,sys; sys.exit(0 if 'typecheck' in json.load(sys.stdin) else 1)" 2>/dev/null; then
+  if has_script typecheck; then
     CMD_TYPECHECK="$PKG_MANAGER run typecheck"
-  elif echo "$SCRIPTS_JSON" | python3 -c "import json,sys; sys.exit(0 if 'type-check' in json.load(sys.stdin) else 1)" 2>/dev/null; then
+  elif has_script type-check; then
     CMD_TYPECHECK="$PKG_MANAGER run type-check"
   elif [ "$HAS_TSCONFIG" = true ]; then
     CMD_TYPECHECK="npx tsc --noEmit"
   fi
 
   # Detect lint command
-  if echo "$SCRIPTS_JSON" | python3 -c "import json,sys; sys.exit(0 if 'lint' in json.load(sys.stdin) else 1)" 2>/dev/null; then
+  if has_script lint; then
     CMD_LINT="$PKG_MANAGER run lint"
   elif [ -f "$PROJECT_DIR/.eslintrc.json" ] || [ -f "$PROJECT_DIR/.eslintrc.js" ] || [ -f "$PROJECT_DIR/.eslintrc.yml" ] || [ -f "$PROJECT_DIR/.eslintrc.yaml" ] || [ -f "$PROJECT_DIR/eslint.config.js" ] || [ -f "$PROJECT_DIR/eslint.config.mjs" ] || [ -f "$PROJECT_DIR/eslint.config.ts" ]; then
     CMD_LINT="npx eslint ."
   fi
 
   # Detect test command
-  if echo "$SCRIPTS_JSON" | python3 -c "import json,sys; sys.exit(0 if 'test' in json.load(sys.stdin) else 1)" 2>/dev/null; then
+  if has_script test; then
     CMD_TEST="$PKG_MANAGER run test"
   elif [ -f "$PROJECT_DIR/jest.config.js" ] || [ -f "$PROJECT_DIR/jest.config.ts" ] || [ -f "$PROJECT_DIR/jest.config.mjs" ]; then
     CMD_TEST="npx jest"
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Test runner — discovers test_*.py files, runs each module's run_tests(), prints combined summary.
+"""Test runner — discovers test_*.py files, runs each module's run_tests() in a worker pool, prints combined summary.
 
 Usage:
     python3 run_tests.py                    # Run all tests
@@ -7,10 +7,14 @@ Usage:
     python3 run_tests.py detect_project     # Run tests matching 'detect_project'
 """
 
+import contextlib
 import importlib
+import io
+import multiprocessing
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -38,12 +42,53 @@ def discover_test_modules(filter_str=None):
     return modules
 
 
-def run_all(filter_str=None):
-    """Discover and run test modules, print combined summary."""
+def run_module(module_name):
+    """Import a test module and run it, capturing everything it prints.
+
+    Runs in a worker process. Returns (module_name, passed, failed, count, output).
+    Only sys.stdout is captured: a child process or fd-level write that
+    goes to the inherited stdout lands on the worker's real stdout, outside
+    the module's ordered output. The harness runners all capture or discard
+    child output, so tests should do the same.
+    """
     # Ensure tests dir is on the path for imports
     if TESTS_DIR not in sys.path:
         sys.path.insert(0, TESTS_DIR)
 
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        error = None
+        try:
+            mod = importlib.import_module(module_name)
+            passed, failed, count = mod.run_tests()
+        except Exception as e:
+            error = str(e)
+        if error is not None:
+            # Reported only after the except block has released the
+            # traceback: the module's TestResults is collected then and
+            # writes its buffered results, so they land above the error
+            print(f"\n{RED}ERROR{NC} loading {module_name}: {error}")
+            passed, failed, count = 0, 1, 1
+    return module_name, passed, failed, count, buf.getvalue()
+
+
+def _limit_concurrency(per_worker):
+    """Pool initializer: cap concurrent subprocesses within this worker.
+
+    Each worker runs its own run_hooks()/run_scripts() batches, so without
+    this the pool would allow workers x HOOK_CONCURRENCY processes at once.
+    An explicit VERIFY_HOOK_CONCURRENCY from the caller is kept.
+    """
+    os.environ.setdefault("VERIFY_HOOK_CONCURRENCY", str(per_worker))
+
+
+def run_all(filter_str=None):
+    """Discover and run test modules, print combined summary.
+
+    Modules run in parallel worker processes (each uses its own TempDir and
+    spends most of its time waiting on hook subprocesses). Output is printed
+    per module in discovery order, so it reads the same as a serial run.
+    """
     modules = discover_test_modules(filter_str)
     if not modules:
         if filter_str:
@@ -58,19 +103,22 @@ def run_all(filter_str=None):
     module_results = []
     start_time = time.time()
 
-    for module_name in modules:
-        try:
-            mod = importlib.import_module(module_name)
-            passed, failed, count = mod.run_tests()
+    # spawn, not fork: workers start clean instead of inheriting this
+    # process's imported modules and open file descriptors
+    cpus = os.cpu_count() or 1
+    workers = min(len(modules), cpus)
+    # Split the harness's 2-per-CPU subprocess budget across the workers
+    per_worker = max(1, 2 * cpus // workers)
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_limit_concurrency,
+                             initargs=(per_worker,)) as pool:
+        for module_name, passed, failed, count, output in pool.map(run_module, modules):
+            sys.stdout.write(output)
             total_passed += passed
             total_failed += failed
             total_tests += count
             module_results.append((module_name, passed, failed, count))
-        except Exception as e:
-            print(f"\n{RED}ERROR{NC} loading {module_name}: {e}")
-            total_failed += 1
-            total_tests += 1
-            module_results.append((module_name, 0, 1, 1))
 
     elapsed = time.time() - start_time
 
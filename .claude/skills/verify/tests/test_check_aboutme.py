@@ -393,7 +393,7 @@ def run_tests():
         make_write_input("src/correct.sh",
                          "# ABOUTME: Correct bash syntax\n# ABOUTME: Uses hash comment\necho hello\n"))
 
-    return t.passed, t.failed, t.total
+    return t.results()
 
 
 if __name__ == "__main__":
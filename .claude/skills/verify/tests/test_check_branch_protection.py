@@ -23,21 +23,34 @@ GIT = shutil.which("git")
 if not GIT:
     raise RuntimeError("git not found on PATH")  # noqa: TRY003
 
+# Fixture commits skip the repo's own hooks; only check-branch-protection.sh
+# is under test.
+COMMIT = "git commit --quiet --no-verify -m"
+
+
+def _git_bulk(cwd, script):
+    """Run a sequence of git commands in one bash process.
+
+    Only stderr is kept, so a failing step raises with git's own message.
+    """
+    result = subprocess.run(
+        ["bash", "-c", script], cwd=cwd,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git setup failed ({script}): {result.stderr.strip()}")  # noqa: TRY003
+
 
 def run_tests():
     t = TestResults("check-branch-protection.sh tests")
     t.header()
 
-    with TempDir() as temp_dir:
-        # Set up a git repo on main with a feature branch
+    with TempDir() as temp_dir, TempDir() as feature_dir:
+        # Set up a git repo on main, with the feature branch checked out in a
+        # linked worktree so each branch keeps its own directory
         setup_git_repo(temp_dir, branch="main")
         subprocess.run(
-            [GIT, "checkout", "-b", "feature/test-branch", "--quiet"],
-            cwd=temp_dir, capture_output=True, check=True,
-        )
-        # Switch back to main for initial tests
-        subprocess.run(
-            [GIT, "checkout", "main", "--quiet"],
+            [GIT, "worktree", "add", "--quiet", "-b", "feature/test-branch", feature_dir],
             cwd=temp_dir, capture_output=True, check=True,
         )
 
@@ -56,25 +69,15 @@ def run_tests():
         # ─── Section 2: Commits on feature branches (should passthrough) ───
         t.section("Commits on feature branches (should passthrough)")
 
-        subprocess.run(
-            [GIT, "checkout", "feature/test-branch", "--quiet"],
-            cwd=temp_dir, capture_output=True, check=True,
-        )
-
         t.assert_allow("commit on feature branch passes through",
-                       HOOK, make_hook_input('git commit -m "feat: add feature"', temp_dir))
+                       HOOK, make_hook_input('git commit -m "feat: add feature"', feature_dir))
 
         t.assert_allow("chained commit on feature branch passes through",
-                       HOOK, make_hook_input('git add . && git commit -m "fix: update"', temp_dir))
+                       HOOK, make_hook_input('git add . && git commit -m "fix: update"', feature_dir))
 
         # ─── Section 3: Commits on main/master (should deny) ───
         t.section("Commits on main/master (should deny)")
 
-        subprocess.run(
-            [GIT, "checkout", "main", "--quiet"],
-            cwd=temp_dir, capture_output=True, check=True,
-        )
-
         t.assert_deny("commit on main is blocked",
                       HOOK, make_hook_input('git commit -m "fix: direct to main"', temp_dir))
 
@@ -92,7 +95,7 @@ def run_tests():
         # ─── Section 4: .skip-branching opt-out (should passthrough) ───
         t.section(".skip-branching opt-out (should passthrough)")
 
-        # Back on main in the main temp_dir
+        # temp_dir stays on main throughout
         write_file(temp_dir, ".skip-branching")
 
         t.assert_allow("commit on main with .skip-branching passes through",
@@ -109,21 +112,9 @@ def run_tests():
         t.assert_allow("non-git directory passes through",
                        HOOK, make_hook_input('git commit -m "test"', "/tmp"))
 
-        # Switch to feature branch for -C tests
-        subprocess.run(
-            [GIT, "checkout", "feature/test-branch", "--quiet"],
-            cwd=temp_dir, capture_output=True, check=True,
-        )
-
         t.assert_allow("commit with -C to feature branch passes through",
                        HOOK, make_hook_input(
-                           f'git -C {temp_dir} commit -m "test"', "/tmp"))
-
-        # Switch back to main for -C deny test
-        subprocess.run(
-            [GIT, "checkout", "main", "--quiet"],
-            cwd=temp_dir, capture_output=True, check=True,
-        )
+                           f'git -C {feature_dir} commit -m "test"', "/tmp"))
 
         t.assert_deny("commit with -C to main is blocked",
                       HOOK, make_hook_input(
@@ -136,134 +127,68 @@ def run_tests():
 
         t.section("Docs-only exemption on main (should allow)")
 
+        # Each step commits the previous step's staged files and stages the
+        # next ones in a single shell, so setup costs one fork per assertion.
+
         # New .md file — should be allowed
         write_file(docs_dir, "README.md", "# Hello")
-        subprocess.run(
-            [GIT, "add", "README.md"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
+        _git_bulk(docs_dir, "git add README.md")
         t.assert_allow("new .md file on main is allowed",
                        HOOK, make_hook_input('git commit -m "docs: add readme"', docs_dir))
-        # Actually commit to clear staging area
-        subprocess.run(
-            [GIT, "commit", "-m", "docs: add readme", "--quiet"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
 
         # Modified .md file — should be allowed
         write_file(docs_dir, "README.md", "# Hello World\nUpdated content.")
-        subprocess.run(
-            [GIT, "add", "README.md"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
+        _git_bulk(docs_dir, f"{COMMIT} 'docs: add readme' && git add README.md")
         t.assert_allow("modified .md file on main is allowed",
                        HOOK, make_hook_input('git commit -m "docs: update readme"', docs_dir))
-        subprocess.run(
-            [GIT, "commit", "-m", "docs: update readme", "--quiet"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
 
         # .md file in subdirectory (e.g. journal/) — should be allowed
         write_file(docs_dir, "journal/2026-02-24.md", "Journal entry")
-        subprocess.run(
-            [GIT, "add", "journal/2026-02-24.md"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
+        _git_bulk(docs_dir, f"{COMMIT} 'docs: update readme' && git add journal/2026-02-24.md")
         t.assert_allow("nested .md file on main is allowed",
                        HOOK, make_hook_input('git commit -m "docs: journal entry"', docs_dir))
-        subprocess.run(
-            [GIT, "commit", "-m", "docs: journal entry", "--quiet"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
 
         # Multiple .md files — should be allowed
         write_file(docs_dir, "CHANGELOG.md", "# Changelog")
         write_file(docs_dir, "docs/guide.md", "# Guide")
-        subprocess.run(
-            [GIT, "add", "CHANGELOG.md", "docs/guide.md"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
+        _git_bulk(docs_dir, f"{COMMIT} 'docs: journal entry' && git add CHANGELOG.md docs/guide.md")
         t.assert_allow("multiple .md files on main is allowed",
                        HOOK, make_hook_input('git commit -m "docs: add docs"', docs_dir))
-        subprocess.run(
-            [GIT, "commit", "-m", "docs: add docs", "--quiet"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
 
         t.section("Docs-only exemption on main (should deny)")
 
         # Mixed commit: .md + .py — should be denied
         write_file(docs_dir, "notes.md", "Notes")
         write_file(docs_dir, "script.py", "print('hi')")
-        subprocess.run(
-            [GIT, "add", "notes.md", "script.py"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
+        _git_bulk(docs_dir, f"{COMMIT} 'docs: add docs' && git add notes.md script.py")
         t.assert_deny("mixed .md + code on main is blocked",
                        HOOK, make_hook_input('git commit -m "mixed commit"', docs_dir))
-        subprocess.run(
-            [GIT, "commit", "-m", "mixed commit", "--quiet"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
 
         # Non-.md file alone — should be denied
         write_file(docs_dir, "config.yaml", "key: value")
-        subprocess.run(
-            [GIT, "add", "config.yaml"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
+        _git_bulk(docs_dir, f"{COMMIT} 'mixed commit' && git add config.yaml")
         t.assert_deny("non-.md file on main is blocked",
                        HOOK, make_hook_input('git commit -m "add config"', docs_dir))
-        subprocess.run(
-            [GIT, "commit", "-m", "add config", "--quiet"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
 
         # .txt file — should be denied (only .md is exempted)
         write_file(docs_dir, "notes.txt", "some notes")
-        subprocess.run(
-            [GIT, "add", "notes.txt"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
+        _git_bulk(docs_dir, f"{COMMIT} 'add config' && git add notes.txt")
         t.assert_deny(".txt file on main is blocked",
                        HOOK, make_hook_input('git commit -m "add txt"', docs_dir))
-        subprocess.run(
-            [GIT, "commit", "-m", "add txt", "--quiet"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
 
         # Deleted .md file — should be denied
-        subprocess.run(
-            [GIT, "rm", "README.md", "--quiet"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
+        _git_bulk(docs_dir, f"{COMMIT} 'add txt' && git rm --quiet README.md")
         t.assert_deny("deleted .md file on main is blocked",
                        HOOK, make_hook_input('git commit -m "remove readme"', docs_dir))
-        subprocess.run(
-            [GIT, "commit", "-m", "remove readme", "--quiet"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
 
         # Renamed .md file — should be denied
         write_file(docs_dir, "old-name.md", "Content for rename test")
-        subprocess.run(
-            [GIT, "add", "old-name.md"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
-        subprocess.run(
-            [GIT, "commit", "-m", "add file for rename", "--quiet"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
-        subprocess.run(
-            [GIT, "mv", "old-name.md", "new-name.md"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
+        _git_bulk(docs_dir, f"{COMMIT} 'remove readme' && git add old-name.md"
+                            f" && {COMMIT} 'add file for rename'"
+                            " && git mv old-name.md new-name.md")
         t.assert_deny("renamed .md file on main is blocked",
                        HOOK, make_hook_input('git commit -m "rename doc"', docs_dir))
-        subprocess.run(
-            [GIT, "commit", "-m", "rename doc", "--quiet"],
-            cwd=docs_dir, capture_output=True, check=True,
-        )
+        _git_bulk(docs_dir, f"{COMMIT} 'rename doc'")
 
         # Nothing staged — should deny (no exemption, no files to check)
         t.section("Docs-only exemption edge cases")
@@ -0,0 +1,192 @@
+# ABOUTME: Tests for check-markdown-codeblocks.sh bare code block detection
+# ABOUTME: Covers fence open/close tracking, indentation, line endings and Unicode whitespace
+"""Tests for check-markdown-codeblocks.sh bare code block detection.
+
+Exercises the checker with:
+- Files with and without language specifiers (and the listing cap)
+- Open/close tracking (closing fences are never flagged)
+- Indented fences, CRLF and CR-only line endings, Unicode whitespace
+- Backticks that are not fences (inline, mid-line)
+- Non-markdown and missing files (skipped)
+- Several files in one call
+- Invalid arguments
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_harness import (
+    TestResults, script_path, run_script_combined, TempDir, write_file,
+)
+
+CHECK = script_path("check-markdown-codeblocks.sh")
+
+
+def run_tests():
+    t = TestResults("check-markdown-codeblocks.sh tests")
+    t.header()
+
+    with TempDir() as tmp:
+        # ─── Section 1: Clean files ───
+        t.section("Clean files (should pass)")
+
+        clean = write_file(tmp, "clean.md",
+                           "# Title\n\n```bash\necho hi\n```\n\n"
+                           "```json\n{}\n```\n")
+        exit_code, output = run_script_combined(CHECK, clean)
+        t.assert_exit_code("labeled fences pass", exit_code, 0)
+        t.assert_equal("labeled fences print nothing", output, "")
+
+        no_fences = write_file(tmp, "no-fences.md", "# Title\n\nJust prose.\n")
+        exit_code, _ = run_script_combined(CHECK, no_fences)
+        t.assert_exit_code("file without fences passes", exit_code, 0)
+
+        empty = write_file(tmp, "empty.md", "")
+        exit_code, _ = run_script_combined(CHECK, empty)
+        t.assert_exit_code("empty file passes", exit_code, 0)
+
+        # ─── Section 2: Bare fences ───
+        t.section("Bare fences (should fail)")
+
+        bare = write_file(tmp, "bare.md",
+                          "# Title\n\n```\nplain\n```\n\ntext\n\n```\nmore\n```\n")
+        exit_code, output = run_script_combined(CHECK, bare)
+        t.assert_exit_code("bare fences fail", exit_code, 1)
+        t.assert_contains("reports count", output, "Found 2 bare code blocks")
+        t.assert_contains("reports first opening line", output, "  Line 3\n")
+        t.assert_contains("reports second opening line", output, "  Line 9\n")
+        t.assert_not_contains("closing fence not reported", output, "  Line 5\n")
+        t.assert_contains("asks for a single edit", output, "Fix ALL 2 code blocks")
+
+        single = write_file(tmp, "single.md", "```\nplain\n```\n")
+        exit_code, output = run_script_combined(CHECK, single)
+        t.assert_exit_code("single bare fence fails", exit_code, 1)
+        t.assert_contains("singular wording", output, "Found 1 bare code block (")
+        t.assert_contains("fence on first line is line 1", output, "  Line 1\n")
+        t.assert_not_contains("no single-edit hint for one block", output, "Fix ALL")
+
+        trailing_ws = write_file(tmp, "trailing-ws.md", "```   \nplain\n```\n")
+        exit_code, _ = run_script_combined(CHECK, trailing_ws)
+        t.assert_exit_code("whitespace after fence is still bare", exit_code, 1)
+
+        unclosed = write_file(tmp, "unclosed.md", "```bash\nok\n```\n\n```\nnever closed\n")
+        exit_code, output = run_script_combined(CHECK, unclosed)
+        t.assert_exit_code("unclosed bare fence fails", exit_code, 1)
+        t.assert_contains("unclosed fence line reported", output, "  Line 5\n")
+
+        many = write_file(tmp, "many.md", "```\nx\n```\n" * 150)
+        exit_code, output = run_script_combined(CHECK, many)
+        t.assert_exit_code("many bare fences fail", exit_code, 1)
+        t.assert_contains("total counts every fence", output, "Found 150 bare code blocks")
+        t.assert_contains("last listed line is the 100th fence", output, "  Line 298\n")
+        t.assert_not_contains("lines past the cap are not listed", output, "  Line 301\n")
+        t.assert_contains("notes the cap", output, "showing first 100 of 150")
+        t.assert_contains("asks to fix every block", output, "Fix ALL 150 code blocks")
+
+        # ─── Section 3: Fence shapes ───
+        t.section("Fence shapes")
+
+        indented = write_file(tmp, "indented.md",
+                              "- item\n\n  ```\n  nested\n  ```\n")
+        exit_code, output = run_script_combined(CHECK, indented)
+        t.assert_exit_code("indented bare fence fails", exit_code, 1)
+        t.assert_contains("indented fence line reported", output, "  Line 3\n")
+
+        crlf = write_file(tmp, "crlf.md", "text\r\n```\r\nplain\r\n```\r\n")
+        exit_code, output = run_script_combined(CHECK, crlf)
+        t.assert_exit_code("CRLF bare fence fails", exit_code, 1)
+        t.assert_contains("CRLF fence line reported", output, "  Line 2\n")
+
+        crlf_clean = write_file(tmp, "crlf-clean.md", "```bash\r\nls\r\n```\r\n")
+        exit_code, _ = run_script_combined(CHECK, crlf_clean)
+        t.assert_exit_code("CRLF labeled fence passes", exit_code, 0)
+
+        cr_only = write_file(tmp, "cr-only.md", "\r```\rplain\r```\r")
+        exit_code, output = run_script_combined(CHECK, cr_only)
+        t.assert_exit_code("CR-only bare fence fails", exit_code, 1)
+        t.assert_contains("CR-only fence line reported", output, "  Line 2\n")
+
+        nbsp_after = write_file(tmp, "nbsp-after.md", "```\xa0\nplain\n```\n")
+        exit_code, output = run_script_combined(CHECK, nbsp_after)
+        t.assert_exit_code("NBSP after fence is still bare", exit_code, 1)
+        t.assert_contains("NBSP-trailed fence line reported", output, "  Line 1\n")
+
+        nbsp_before = write_file(tmp, "nbsp-before.md",
+                                 "\xa0```\nplain\n```\n\n```bash\nls\n```\n")
+        exit_code, output = run_script_combined(CHECK, nbsp_before)
+        t.assert_exit_code("NBSP-indented bare fence fails", exit_code, 1)
+        t.assert_contains("NBSP-indented fence is the opening one",
+                          output, "Found 1 bare code block (")
+        t.assert_contains("NBSP-indented fence line reported", output, "  Line 1\n")
+
+        form_feed = write_file(tmp, "form-feed.md", "\f```\f\nplain\n```\n")
+        exit_code, output = run_script_combined(CHECK, form_feed)
+        t.assert_exit_code("form feeds around a bare fence still fail", exit_code, 1)
+        t.assert_contains("form-feed fence line reported", output, "  Line 1\n")
+
+        inline = write_file(tmp, "inline.md",
+                            "Use ``` to open a block.\n\nSee `code` here.\n")
+        exit_code, _ = run_script_combined(CHECK, inline)
+        t.assert_exit_code("mid-line backticks are not fences", exit_code, 0)
+
+        four = write_file(tmp, "four.md", "````\nraw\n````\n")
+        exit_code, _ = run_script_combined(CHECK, four)
+        t.assert_exit_code("four-backtick fence is not bare", exit_code, 0)
+
+        inner = write_file(tmp, "inner.md",
+                           "```markdown\n```\n```\nbare\n```\n")
+        exit_code, output = run_script_combined(CHECK, inner)
+        t.assert_exit_code("open/close state carries across blocks", exit_code, 1)
+        t.assert_contains("only the later opening fence reported",
+                          output, "Found 1 bare code block (")
+        t.assert_contains("later opening fence line reported", output, "  Line 3\n")
+
+        # ─── Section 4: Skipped inputs ───
+        t.section("Skipped inputs (should pass)")
+
+        not_markdown = write_file(tmp, "notes.txt", "```\nplain\n```\n")
+        exit_code, _ = run_script_combined(CHECK, not_markdown)
+        t.assert_exit_code("non-markdown file is skipped", exit_code, 0)
+
+        mdx = write_file(tmp, "page.mdx", "```\nplain\n```\n")
+        exit_code, _ = run_script_combined(CHECK, mdx)
+        t.assert_exit_code(".mdx file is checked", exit_code, 1)
+
+        exit_code, _ = run_script_combined(CHECK, os.path.join(tmp, "missing.md"))
+        t.assert_exit_code("missing file is skipped", exit_code, 0)
+
+        os.makedirs(os.path.join(tmp, "dir.md"))
+        exit_code, _ = run_script_combined(CHECK, os.path.join(tmp, "dir.md"))
+        t.assert_exit_code("directory named .md is skipped", exit_code, 0)
+
+        # ─── Section 5: Multiple files in one call ───
+        t.section("Multiple files in one call")
+
+        exit_code, output = run_script_combined(CHECK, clean, no_fences, not_markdown)
+        t.assert_exit_code("all clean (non-markdown skipped) passes", exit_code, 0)
+
+        exit_code, output = run_script_combined(CHECK, clean, bare, single)
+        t.assert_exit_code("any file with bare fences fails", exit_code, 1)
+        t.assert_contains("reports first failing file", output, f"in {bare}:")
+        t.assert_contains("reports second failing file", output, f"in {single}:")
+        t.assert_not_contains("clean file not reported", output, f"in {clean}:")
+
+        exit_code, _ = run_script_combined(
+            CHECK, os.path.join(tmp, "missing.md"), single)
+        t.assert_exit_code("missing file does not stop later files", exit_code, 1)
+
+        # ─── Section 6: Invalid arguments ───
+        t.section("Invalid arguments")
+
+        exit_code, output = run_script_combined(CHECK)
+        t.assert_exit_code("no arguments exits 2", exit_code, 2)
+        t.assert_contains("prints usage", output, "Usage")
+
+    t.summary()
+    return t.passed, t.failed, t.total
+
+
+if __name__ == "__main__":
+    passed, failed, total = run_tests()
+    sys.exit(0 if failed == 0 else 1)
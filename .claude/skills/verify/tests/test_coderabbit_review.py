@@ -14,40 +14,45 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from test_harness import (
-    TestResults, script_path, TempDir, setup_git_repo,
-    write_file, make_executable, run_script_combined,
+    TestResults, script_path, TempDir, session_repo,
+    write_executable, run_script_combined,
 )
 
 SCRIPT = script_path("coderabbit-review.sh")
 
+# Snapshot of the environment as a plain dict; copying it is cheaper than
+# os.environ.copy(), which decodes every entry again
+_BASE_ENV = dict(os.environ)
 
-def create_mock_coderabbit(temp_dir, output="No issues found.", exit_code=0):
-    """Create a mock coderabbit CLI that returns fixed output.
 
-    Uses a separate file for output to avoid shell-quote injection issues.
+def create_mock_coderabbit(temp_dir):
+    """Create a mock coderabbit CLI shared by every section.
+
+    The review output and exit code come from MOCK_CODERABBIT_OUTPUT and
+    MOCK_CODERABBIT_EXIT_CODE (set per call by run_review), so one stub
+    serves every scenario. Printing an env var also avoids shell-quote
+    injection from the output text.
     Returns the path to a bin directory that should be prepended to PATH.
     """
-    bin_dir = os.path.join(temp_dir, "mock-bin")
-    os.makedirs(bin_dir, exist_ok=True)
-    output_file = os.path.join(bin_dir, "coderabbit-output.txt")
-    with open(output_file, "w") as f:
-        f.write(output)
-    cr_script = os.path.join(bin_dir, "coderabbit")
-    write_file(temp_dir, "mock-bin/coderabbit", f"""#!/usr/bin/env bash
+    cr_script = write_executable(temp_dir, "mock-bin/coderabbit", """#!/usr/bin/env bash
 # Mock coderabbit CLI for testing
-if echo "$@" | grep -q "review"; then
-    cat "{output_file}"
-    exit {exit_code}
+if [[ "$*" == *"review"* ]]; then
+    printf '%s' "$MOCK_CODERABBIT_OUTPUT"
+    exit "${MOCK_CODERABBIT_EXIT_CODE:-0}"
 fi
 exit 0
 """)
-    make_executable(cr_script)
-    return bin_dir
+    return os.path.dirname(cr_script)
 
 
-def run_review(project_dir, base_branch="", extra_path=None, home_override=None):
+def run_review(project_dir, base_branch="", extra_path=None, home_override=None,
+               mock_output="No issues found.", mock_exit_code=0):
     """Run coderabbit-review.sh with controlled environment."""
-    env = os.environ.copy()
+    env = {
+        **_BASE_ENV,
+        "MOCK_CODERABBIT_OUTPUT": mock_output,
+        "MOCK_CODERABBIT_EXIT_CODE": str(mock_exit_code),
+    }
     if extra_path:
         env["PATH"] = f"{extra_path}:{env['PATH']}"
     if home_override:
@@ -71,19 +76,18 @@ def run_tests():
     t = TestResults("coderabbit-review.sh tests")
     t.header()
 
+    # The script only reads the repo, so every section shares one
+    repo = session_repo("main")
+
     # ─── Section 1: CLI not installed ───
     t.section("CLI not installed")
 
     with TempDir() as temp_dir:
-        repo = setup_git_repo(temp_dir)
-
         # Use a minimal PATH that excludes coderabbit, and a fake HOME.
         # os.defpath provides the OS default PATH (portable across platforms).
         fake_home = os.path.join(temp_dir, "fake-home")
         os.makedirs(fake_home, exist_ok=True)
-        minimal_env = os.environ.copy()
-        minimal_env["PATH"] = os.defpath
-        minimal_env["HOME"] = fake_home
+        minimal_env = {**_BASE_ENV, "PATH": os.defpath, "HOME": fake_home}
 
         result = subprocess.run(
             [SCRIPT, repo, "main"],
@@ -97,12 +101,12 @@ def run_tests():
         t.assert_contains("reports CLI not installed",
                           result.stdout + result.stderr, "not installed")
 
-    # ─── Section 2: No base branch ───
-    t.section("No base branch determinable")
+    # One mock CLI serves sections 2-6; each call picks its output and exit code
+    with TempDir() as mock_dir:
+        mock_bin = create_mock_coderabbit(mock_dir)
 
-    with TempDir() as temp_dir:
-        repo = setup_git_repo(temp_dir)
-        mock_bin = create_mock_coderabbit(temp_dir)
+        # ─── Section 2: No base branch ───
+        t.section("No base branch determinable")
 
         # Don't provide a base branch and repo has no origin/main
         exit_code, output = run_review(repo, extra_path=mock_bin)
@@ -111,60 +115,46 @@ def run_tests():
         t.assert_contains("reports no base branch",
                           output, "Cannot determine base branch")
 
-    # ─── Section 3: CLI returns findings ───
-    t.section("CLI returns review findings")
+        # ─── Section 3: CLI returns findings ───
+        t.section("CLI returns review findings")
 
-    with TempDir() as temp_dir:
-        repo = setup_git_repo(temp_dir)
         findings = "Issue: Missing error handling in src/app.ts:42"
-        mock_bin = create_mock_coderabbit(temp_dir, output=findings)
-
         exit_code, output = run_review(repo, base_branch="main",
-                                       extra_path=mock_bin)
+                                       extra_path=mock_bin, mock_output=findings)
 
         t.assert_equal("exits 0 with findings", exit_code, 0)
         t.assert_contains("includes review findings", output, findings)
         t.assert_contains("reports review complete",
                           output, "CodeRabbit CLI review complete")
 
-    # ─── Section 4: CLI returns clean review ───
-    t.section("CLI returns clean review (no issues)")
-
-    with TempDir() as temp_dir:
-        repo = setup_git_repo(temp_dir)
-        mock_bin = create_mock_coderabbit(temp_dir, output="No issues found.")
+        # ─── Section 4: CLI returns clean review ───
+        t.section("CLI returns clean review (no issues)")
 
         exit_code, output = run_review(repo, base_branch="main",
-                                       extra_path=mock_bin)
+                                       extra_path=mock_bin,
+                                       mock_output="No issues found.")
 
         t.assert_equal("exits 0 with clean review", exit_code, 0)
         t.assert_contains("includes clean output", output, "No issues found.")
         t.assert_contains("reports review complete",
                           output, "CodeRabbit CLI review complete")
 
-    # ─── Section 5: CLI fails ───
-    t.section("CLI failure handling")
-
-    with TempDir() as temp_dir:
-        repo = setup_git_repo(temp_dir)
-        mock_bin = create_mock_coderabbit(temp_dir, output="", exit_code=1)
+        # ─── Section 5: CLI fails ───
+        t.section("CLI failure handling")
 
         exit_code, output = run_review(repo, base_branch="main",
-                                       extra_path=mock_bin)
+                                       extra_path=mock_bin,
+                                       mock_output="", mock_exit_code=1)
 
         t.assert_equal("exits 0 when CLI fails", exit_code, 0)
         t.assert_contains("reports failure gracefully",
                           output, "skipping")
 
-    # ─── Section 6: Explicit base branch passed through ───
-    t.section("Base branch handling")
-
-    with TempDir() as temp_dir:
-        repo = setup_git_repo(temp_dir)
-        mock_bin = create_mock_coderabbit(temp_dir, output="Clean.")
+        # ─── Section 6: Explicit base branch passed through ───
+        t.section("Base branch handling")
 
         exit_code, output = run_review(repo, base_branch="origin/main",
-                                       extra_path=mock_bin)
+                                       extra_path=mock_bin, mock_output="Clean.")
 
         t.assert_equal("exits 0 with explicit base", exit_code, 0)
         t.assert_contains("reports base branch",
@@ -15,27 +15,107 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from test_harness import (
-    TestResults, script_path, run_script, TempDir, write_file, make_executable,
+    TestResults, script_path, run_script_each, TempDir, write_executable,
+    build_projects, path_without,
 )
 
 DETECT = script_path("detect-project.sh")
 
-
-def _run_detect(project_dir, extra_path=None):
-    """Run detect-project.sh against a directory, optionally prepending to PATH."""
-    env = os.environ.copy()
-    if extra_path:
-        env["PATH"] = extra_path + ":" + env.get("PATH", "")
-    _, stdout = run_script(DETECT, project_dir, env=env)
-    return stdout.strip()
-
-
-def _path_without_golangci_lint():
-    """Return PATH with golangci-lint locations stripped."""
-    return ":".join(
-        p for p in os.environ.get("PATH", "").split(":")
-        if "golangci-lint" not in p
-    )
+# PATH does not change during the run, so it is read once
+_PATH = os.environ.get("PATH", "")
+
+
+GO_MOD = "module example.com/test\n"
+
+# Fixture projects: key -> (directory name, {relative path: content}).
+# Every project is read-only, so each one is built once and shared by
+# every run and section that needs it.
+PROJECT_SPECS = {
+    # Go project with Makefile (all targets)
+    "go_makefile_all": ("go-makefile-all", {
+        "go.mod": GO_MOD,
+        "Makefile": ".PHONY: build lint test vet\n\n"
+                    "build:\n\tgo build ./...\n\n"
+                    "lint:\n\tgolangci-lint run\n\n"
+                    "test:\n\tgo test ./...\n\n"
+                    "vet:\n\tgo vet ./...\n",
+    }),
+    # Go project with partial Makefile (no lint)
+    "go_makefile_partial": ("go-makefile-partial", {
+        "go.mod": GO_MOD,
+        "Makefile": ".PHONY: build test\n\n"
+                    "build:\n\tgo build ./...\n\n"
+                    "test:\n\tgo test ./...\n",
+    }),
+    # Go project without Makefile
+    "go_no_makefile": ("go-no-makefile", {
+        "go.mod": GO_MOD,
+    }),
+    # Go project with Makefile vet target (no lint)
+    "go_makefile_vet": ("go-makefile-vet", {
+        "go.mod": GO_MOD,
+        "Makefile": ".PHONY: build test vet\n\n"
+                    "build:\n\tgo build ./...\n\n"
+                    "test:\n\tgo test ./...\n\n"
+                    "vet:\n\tgo vet ./...\n",
+    }),
+    # Node.js project
+    "node_project": ("node-project", {
+        "package.json": '{"scripts":{"build":"tsc","lint":"eslint .","test":"vitest"}}',
+        "tsconfig.json": "{}",
+    }),
+    # Unknown project (also the "no run_tests.py" case). detect-project.sh
+    # only probes named files, so an empty directory is enough here and
+    # the fixtures below carry only the files they are about.
+    "unknown_project": ("unknown", {}),
+    # verify.json with test command only
+    "verify_test_only": ("verify-test-only", {
+        ".claude/verify.json": '{"commands": {"test": "python3 run_tests.py"}}',
+    }),
+    # verify.json with all commands
+    "verify_all": ("verify-all-cmds", {
+        ".claude/verify.json":
+            '{"commands": {"build": "make build", "lint": "make lint",'
+            ' "test": "make test", "typecheck": "make typecheck"}}',
+    }),
+    # Node.js project with verify.json test override
+    "verify_override": ("verify-override", {
+        "package.json": '{"scripts":{"build":"tsc","test":"vitest"}}',
+        ".claude/verify.json": '{"commands": {"test": "python3 custom_tests.py"}}',
+    }),
+    # Go project with verify.json test override
+    "verify_partial": ("verify-partial", {
+        "go.mod": GO_MOD,
+        ".claude/verify.json": '{"commands": {"test": "python3 run_tests.py"}}',
+    }),
+    # Go project with invalid verify.json
+    "verify_invalid": ("verify-invalid", {
+        "go.mod": GO_MOD,
+        ".claude/verify.json": "not valid json{{{",
+    }),
+    # Unknown project with run_tests.py
+    "fallback_project": ("fallback-runner", {
+        "run_tests.py": "#!/usr/bin/env python3\nprint('tests')\n",
+    }),
+    # verify.json with acceptance_test
+    "accept_project": ("accept-test", {
+        "package.json": '{"scripts":{"build":"tsc","test":"vitest"}}',
+        ".claude/verify.json":
+            '{"commands": {"test": "npm run test",'
+            ' "acceptance_test": "vals exec -f .vals.yaml -- npx vitest run test/**/acceptance-gate.test.ts"}}',
+    }),
+    # verify.json with acceptance_test only
+    "accept_only": ("accept-only", {
+        ".claude/verify.json": '{"commands": {"acceptance_test": "python3 run_acceptance.py"}}',
+    }),
+}
+
+
+def _env_with_path(path):
+    """Return a copy of the environment with PATH replaced."""
+    env = dict(os.environ)
+    env["PATH"] = path
+    return env
 
 
 def run_tests():
@@ -46,54 +126,41 @@ def run_tests():
         # ── Setup: fake golangci-lint binary ──
         fake_bin = os.path.join(tmp, "fake-bin")
         os.makedirs(fake_bin)
-        write_file(fake_bin, "golangci-lint",
-                   '#!/usr/bin/env bash\necho "golangci-lint fake"\n')
-        make_executable(os.path.join(fake_bin, "golangci-lint"))
-
-        path_with_lint = fake_bin + ":" + os.environ.get("PATH", "")
-        path_without_lint = _path_without_golangci_lint()
-
-        # ── Setup: Go project with Makefile (all targets) ──
-        go_makefile_all = os.path.join(tmp, "go-makefile-all")
-        os.makedirs(go_makefile_all)
-        write_file(go_makefile_all, "go.mod", "module example.com/test\n")
-        write_file(go_makefile_all, "Makefile",
-                   ".PHONY: build lint test vet\n\n"
-                   "build:\n\tgo build ./...\n\n"
-                   "lint:\n\tgolangci-lint run\n\n"
-                   "test:\n\tgo test ./...\n\n"
-                   "vet:\n\tgo vet ./...\n")
-
-        # ── Setup: Go project with partial Makefile (no lint) ──
-        go_makefile_partial = os.path.join(tmp, "go-makefile-partial")
-        os.makedirs(go_makefile_partial)
-        write_file(go_makefile_partial, "go.mod", "module example.com/test\n")
-        write_file(go_makefile_partial, "Makefile",
-                   ".PHONY: build test\n\n"
-                   "build:\n\tgo build ./...\n\n"
-                   "test:\n\tgo test ./...\n")
-
-        # ── Setup: Go project without Makefile ──
-        go_no_makefile = os.path.join(tmp, "go-no-makefile")
-        os.makedirs(go_no_makefile)
-        write_file(go_no_makefile, "go.mod", "module example.com/test\n")
-
-        # ── Setup: Node.js project ──
-        node_project = os.path.join(tmp, "node-project")
-        os.makedirs(node_project)
-        write_file(node_project, "package.json",
-                   '{"scripts":{"build":"tsc","lint":"eslint .","test":"vitest"}}')
-        write_file(node_project, "tsconfig.json", "{}")
-
-        # ── Setup: Unknown project ──
-        unknown_project = os.path.join(tmp, "unknown")
-        os.makedirs(unknown_project)
-        write_file(unknown_project, "README.md", "readme\n")
+        write_executable(fake_bin, "golangci-lint",
+                         '#!/usr/bin/env bash\necho "golangci-lint fake"\n')
+
+        # Built once and shared by every section below; none of them mutate
+        env_with = _env_with_path(fake_bin + ":" + _PATH)
+        env_without = _env_with_path(path_without(tmp, "golangci-lint"))
+
+        proj = build_projects(tmp, PROJECT_SPECS)
+
+        # ── Run detect-project.sh against every fixture ──
+        # Each run only reads its own fixture directory, so they run
+        # concurrently and the sections below assert on the stored output
+        detected = run_script_each(DETECT, {
+            "go_makefile_all": ([proj["go_makefile_all"]], env_with),
+            "go_makefile_partial_with_lint": ([proj["go_makefile_partial"]], env_with),
+            "go_makefile_partial_without_lint": ([proj["go_makefile_partial"]], env_without),
+            "go_no_makefile_with_lint": ([proj["go_no_makefile"]], env_with),
+            "go_no_makefile_without_lint": ([proj["go_no_makefile"]], env_without),
+            "node_project": ([proj["node_project"]], None),
+            "unknown_project": ([proj["unknown_project"]], None),
+            "go_makefile_vet": ([proj["go_makefile_vet"]], env_without),
+            "verify_test_only": ([proj["verify_test_only"]], None),
+            "verify_all": ([proj["verify_all"]], None),
+            "verify_override": ([proj["verify_override"]], None),
+            "verify_partial": ([proj["verify_partial"]], None),
+            "verify_invalid": ([proj["verify_invalid"]], None),
+            "fallback_project": ([proj["fallback_project"]], None),
+            "accept_project": ([proj["accept_project"]], None),
+            "accept_only": ([proj["accept_only"]], None),
+        })
 
         # ── Section 1: Go with Makefile (all targets) ──
         t.section("Go with Makefile (all targets)")
 
-        output = _run_detect(go_makefile_all, extra_path=fake_bin)
+        _, output = detected["go_makefile_all"]
 
         t.assert_field("project type is go",
                        output, "project_type", "go")
@@ -111,10 +178,7 @@ def run_tests():
         # ── Section 2: Go with partial Makefile (no lint target) ──
         t.section("Go with partial Makefile (no lint target)")
 
-        env_with = os.environ.copy()
-        env_with["PATH"] = path_with_lint
-        _, stdout = run_script(DETECT, go_makefile_partial, env=env_with)
-        output = stdout.strip()
+        _, output = detected["go_makefile_partial_with_lint"]
 
         t.assert_field("build uses make build",
                        output, "commands.build", "make build")
@@ -123,10 +187,7 @@ def run_tests():
         t.assert_field("test uses make test",
                        output, "commands.test", "make test")
 
-        env_without = os.environ.copy()
-        env_without["PATH"] = path_without_lint
-        _, stdout = run_script(DETECT, go_makefile_partial, env=env_without)
-        output = stdout.strip()
+        _, output = detected["go_makefile_partial_without_lint"]
 
         t.assert_field("lint falls back to go vet without golangci-lint",
                        output, "commands.lint", "go vet ./...")
@@ -134,9 +195,7 @@ def run_tests():
         # ── Section 3: Go without Makefile ──
         t.section("Go without Makefile")
 
-        env_with["PATH"] = path_with_lint
-        _, stdout = run_script(DETECT, go_no_makefile, env=env_with)
-        output = stdout.strip()
+        _, output = detected["go_no_makefile_with_lint"]
 
         t.assert_field("build is go build",
                        output, "commands.build", "go build ./...")
@@ -147,9 +206,7 @@ def run_tests():
         t.assert_field_empty("typecheck is empty",
                              output, "commands.typecheck")
 
-        env_without["PATH"] = path_without_lint
-        _, stdout = run_script(DETECT, go_no_makefile, env=env_without)
-        output = stdout.strip()
+        _, output = detected["go_no_makefile_without_lint"]
 
         t.assert_field("lint falls back to go vet without golangci-lint",
                        output, "commands.lint", "go vet ./...")
@@ -161,7 +218,7 @@ def run_tests():
         # ── Section 4: Node.js project (regression) ──
         t.section("Node.js project (regression)")
 
-        output = _run_detect(node_project)
+        _, output = detected["node_project"]
 
         t.assert_field("project type is node-typescript",
                        output, "project_type", "node-typescript")
@@ -175,7 +232,7 @@ def run_tests():
         # ── Section 5: Unknown project ──
         t.section("Unknown project")
 
-        output = _run_detect(unknown_project)
+        _, output = detected["unknown_project"]
 
         t.assert_field("project type is unknown",
                        output, "project_type", "unknown")
@@ -191,18 +248,7 @@ def run_tests():
         # ── Section 6: Go Makefile with vet target ──
         t.section("Go Makefile vet target detection")
 
-        go_makefile_vet = os.path.join(tmp, "go-makefile-vet")
-        os.makedirs(go_makefile_vet)
-        write_file(go_makefile_vet, "go.mod", "module example.com/test\n")
-        write_file(go_makefile_vet, "Makefile",
-                   ".PHONY: build test vet\n\n"
-                   "build:\n\tgo build ./...\n\n"
-                   "test:\n\tgo test ./...\n\n"
-                   "vet:\n\tgo vet ./...\n")
-
-        env_without["PATH"] = path_without_lint
-        _, stdout = run_script(DETECT, go_makefile_vet, env=env_without)
-        output = stdout.strip()
+        _, output = detected["go_makefile_vet"]
 
         t.assert_field("lint uses make vet when no lint target and no golangci-lint",
                        output, "commands.lint", "make vet")
@@ -210,13 +256,7 @@ def run_tests():
         # ── Section 7: verify.json override — test command ──
         t.section("verify.json override — test command only")
 
-        verify_test_only = os.path.join(tmp, "verify-test-only")
-        os.makedirs(os.path.join(verify_test_only, ".claude"))
-        write_file(verify_test_only, "README.md", "readme\n")
-        write_file(verify_test_only, ".claude/verify.json",
-                   '{"commands": {"test": "python3 run_tests.py"}}')
-
-        output = _run_detect(verify_test_only)
+        _, output = detected["verify_test_only"]
 
         t.assert_field("project type is unknown (no standard config)",
                        output, "project_type", "unknown")
@@ -230,14 +270,7 @@ def run_tests():
         # ── Section 8: verify.json override — all commands ──
         t.section("verify.json override — all commands")
 
-        verify_all = os.path.join(tmp, "verify-all-cmds")
-        os.makedirs(os.path.join(verify_all, ".claude"))
-        write_file(verify_all, "README.md", "readme\n")
-        write_file(verify_all, ".claude/verify.json",
-                   '{"commands": {"build": "make build", "lint": "make lint",'
-                   ' "test": "make test", "typecheck": "make typecheck"}}')
-
-        output = _run_detect(verify_all)
+        _, output = detected["verify_all"]
 
         t.assert_field("build from verify.json",
                        output, "commands.build", "make build")
@@ -251,14 +284,7 @@ def run_tests():
         # ── Section 9: verify.json overrides auto-detected commands ──
         t.section("verify.json overrides auto-detected commands")
 
-        verify_override = os.path.join(tmp, "verify-override")
-        os.makedirs(os.path.join(verify_override, ".claude"))
-        write_file(verify_override, "package.json",
-                   '{"scripts":{"build":"tsc","test":"vitest"}}')
-        write_file(verify_override, ".claude/verify.json",
-                   '{"commands": {"test": "python3 custom_tests.py"}}')
-
-        output = _run_detect(verify_override)
+        _, output = detected["verify_override"]
 
         t.assert_field("project type still detected from package.json",
                        output, "project_type", "node-javascript")
@@ -270,13 +296,7 @@ def run_tests():
         # ── Section 10: verify.json partial override preserves auto-detect ──
         t.section("verify.json partial override preserves auto-detect")
 
-        verify_partial = os.path.join(tmp, "verify-partial")
-        os.makedirs(os.path.join(verify_partial, ".claude"))
-        write_file(verify_partial, "go.mod", "module example.com/test\n")
-        write_file(verify_partial, ".claude/verify.json",
-                   '{"commands": {"test": "python3 run_tests.py"}}')
-
-        output = _run_detect(verify_partial)
+        _, output = detected["verify_partial"]
 
         t.assert_field("project type still go",
                        output, "project_type", "go")
@@ -288,12 +308,7 @@ def run_tests():
         # ── Section 11: invalid verify.json is ignored ──
         t.section("invalid verify.json is gracefully ignored")
 
-        verify_invalid = os.path.join(tmp, "verify-invalid")
-        os.makedirs(os.path.join(verify_invalid, ".claude"))
-        write_file(verify_invalid, "go.mod", "module example.com/test\n")
-        write_file(verify_invalid, ".claude/verify.json", "not valid json{{{")
-
-        output = _run_detect(verify_invalid)
+        _, output = detected["verify_invalid"]
 
         t.assert_field("project type still go despite bad verify.json",
                        output, "project_type", "go")
@@ -303,13 +318,7 @@ def run_tests():
         # ── Section 12: run_tests.py fallback detection ──
         t.section("run_tests.py fallback detection")
 
-        fallback_project = os.path.join(tmp, "fallback-runner")
-        os.makedirs(fallback_project)
-        write_file(fallback_project, "README.md", "readme\n")
-        write_file(fallback_project, "run_tests.py",
-                   "#!/usr/bin/env python3\nprint('tests')\n")
-
-        output = _run_detect(fallback_project)
+        _, output = detected["fallback_project"]
 
         t.assert_field("project type is unknown",
                        output, "project_type", "unknown")
@@ -319,11 +328,7 @@ def run_tests():
         # ── Section 13: no fallback when no run_tests.py ──
         t.section("no fallback without run_tests.py")
 
-        no_runner = os.path.join(tmp, "no-runner")
-        os.makedirs(no_runner)
-        write_file(no_runner, "README.md", "readme\n")
-
-        output = _run_detect(no_runner)
+        _, output = detected["unknown_project"]
 
         t.assert_field_empty("test still empty without run_tests.py",
                              output, "commands.test")
@@ -331,15 +336,7 @@ def run_tests():
         # ── Section 14: verify.json acceptance_test extraction ──
         t.section("verify.json acceptance_test extraction")
 
-        accept_project = os.path.join(tmp, "accept-test")
-        os.makedirs(os.path.join(accept_project, ".claude"))
-        write_file(accept_project, "package.json",
-                   '{"scripts":{"build":"tsc","test":"vitest"}}')
-        write_file(accept_project, ".claude/verify.json",
-                   '{"commands": {"test": "npm run test",'
-                   ' "acceptance_test": "vals exec -f .vals.yaml -- npx vitest run test/**/acceptance-gate.test.ts"}}')
-
-        output = _run_detect(accept_project)
+        _, output = detected["accept_project"]
 
         t.assert_field("acceptance_test extracted from verify.json",
                        output, "commands.acceptance_test",
@@ -350,7 +347,7 @@ def run_tests():
         # ── Section 15: no acceptance_test key → null in output ──
         t.section("no acceptance_test key produces null")
 
-        output = _run_detect(node_project)
+        _, output = detected["node_project"]
 
         t.assert_field_empty("acceptance_test is empty when not in verify.json",
                              output, "commands.acceptance_test")
@@ -358,13 +355,7 @@ def run_tests():
         # ── Section 16: acceptance_test only in verify.json ──
         t.section("acceptance_test only (no other overrides)")
 
-        accept_only = os.path.join(tmp, "accept-only")
-        os.makedirs(os.path.join(accept_only, ".claude"))
-        write_file(accept_only, "README.md", "readme\n")
-        write_file(accept_only, ".claude/verify.json",
-                   '{"commands": {"acceptance_test": "python3 run_acceptance.py"}}')
-
-        output = _run_detect(accept_only)
+        _, output = detected["accept_only"]
 
         t.assert_field("acceptance_test extracted when it is the only command",
                        output, "commands.acceptance_test",
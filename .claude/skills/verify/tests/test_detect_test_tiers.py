@@ -16,15 +16,137 @@ import os
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from test_harness import TestResults, script_path, run_script, TempDir, write_file
+from test_harness import TestResults, script_path, run_script_each, TempDir, build_projects
 
 DETECT = script_path("detect-test-tiers.sh")
 
+GO_MOD = "module example.com/test\n"
+
+
+def _go_test(package, func, message, build_tag=None):
+    """Return a minimal Go test file that logs message from Test<func>."""
+    header = f"//go:build {build_tag}\n\n" if build_tag else ""
+    return (f'{header}package {package}\n\nimport "testing"\n\n'
+            f'func Test{func}(t *testing.T) {{\n'
+            f'\tt.Log("{message}")\n}}\n')
+
+
+# A plain unit test in package main, shared by several Go fixtures
+GO_MAIN_UNIT_TEST = _go_test("main", "Main", "unit test")
+
+# Fixture projects: key -> (directory name, {relative path: content}).
+# Every project is read-only, so each one is built once up front.
+PROJECT_SPECS = {
+    # Go project with no tests
+    "go_no_tests": ("go-no-tests", {
+        "go.mod": GO_MOD,
+        "main.go": "package main\n\nfunc main() {}\n",
+    }),
+    # Go project with unit tests only
+    "go_unit_only": ("go-unit-only", {
+        "go.mod": GO_MOD,
+        "pkg/handler/handler_test.go":
+            _go_test("handler", "HandleRequest", "unit test"),
+    }),
+    # Go project with integration build tag
+    "go_integration_tag": ("go-integration-tag", {
+        "go.mod": GO_MOD,
+        "pkg/db_test.go":
+            _go_test("pkg", "DBConnection", "unit test"),
+        "pkg/db_integration_test.go":
+            _go_test("pkg", "DBIntegration", "integration test", build_tag="integration"),
+    }),
+    # Go project with tests/integration/ directory
+    "go_integration_dir": ("go-integration-dir", {
+        "go.mod": GO_MOD,
+        "main_test.go": GO_MAIN_UNIT_TEST,
+        "tests/integration/api_test.go":
+            _go_test("integration", "API", "integration test"),
+    }),
+    # Go project with e2e build tag
+    "go_e2e_tag": ("go-e2e-tag", {
+        "go.mod": GO_MOD,
+        "main_test.go": GO_MAIN_UNIT_TEST,
+        "test/e2e_test.go":
+            _go_test("test", "E2E", "e2e test", build_tag="e2e"),
+    }),
+    # Go project with envtest (Kubebuilder)
+    "go_envtest": ("go-envtest", {
+        "go.mod": GO_MOD,
+        "internal/controller/suite_test.go":
+            'package controller\n\nimport (\n\t"testing"\n\n'
+            '\t"sigs.k8s.io/controller-runtime/pkg/envtest"\n)\n\n'
+            'var testEnv *envtest.Environment\n\n'
+            'func TestMain(m *testing.M) {\n'
+            '\ttestEnv = &envtest.Environment{}\n}\n',
+    }),
+    # Go project with Kind cluster
+    "go_kind": ("go-kind", {
+        "go.mod": GO_MOD,
+        "main_test.go": GO_MAIN_UNIT_TEST,
+        "test/e2e/cluster_test.go":
+            'package e2e\n\nimport (\n\t"testing"\n\n'
+            '\t"sigs.k8s.io/kind/pkg/cluster"\n)\n\n'
+            'func TestClusterSetup(t *testing.T) {\n'
+            '\tprovider := cluster.NewProvider()\n'
+            '\t_ = provider\n}\n',
+    }),
+    # Go project with all three tiers
+    "go_all_tiers": ("go-all-tiers", {
+        "go.mod": GO_MOD,
+        "pkg/handler_test.go":
+            _go_test("pkg", "Handler", "unit test"),
+        "pkg/handler_integration_test.go":
+            _go_test("pkg", "HandlerIntegration", "integration test", build_tag="integration"),
+        "test/e2e/e2e_test.go":
+            _go_test("e2e", "EndToEnd", "e2e test", build_tag="e2e"),
+    }),
+    # Go project with tests/e2e/ directory (no build tag)
+    "go_e2e_dir": ("go-e2e-dir", {
+        "go.mod": GO_MOD,
+        "main_test.go": GO_MAIN_UNIT_TEST,
+        "tests/e2e/smoke_test.go":
+            _go_test("e2e", "Smoke", "e2e test"),
+    }),
+    # Go project with only build-tagged tests
+    "go_only_tagged": ("go-only-tagged", {
+        "go.mod": GO_MOD,
+        "pkg/integration_test.go":
+            _go_test("pkg", "Integration", "integration only", build_tag="integration"),
+    }),
+    # Node.js regression project
+    "node_proj": ("node-regression", {
+        "package.json": '{"scripts":{"test":"vitest"}}',
+        "tests/unit/example.test.js": 'describe("unit", () => {})',
+        "tests/integration/api.test.js": 'describe("int", () => {})',
+    }),
+    # Node.js colocated integration tests
+    "node_colocated_int": ("node-colocated-integration", {
+        "package.json": '{"scripts":{"test":"vitest"}}',
+        "tsconfig.json": '{"compilerOptions":{}}',
+        "src/pipeline/runner.test.ts": 'describe("runner", () => {})',
+        "src/pipeline/runner.integration.test.ts":
+            'describe("runner integration", () => {})',
+        "src/pipeline/storage.integration.test.ts":
+            'describe("storage integration", () => {})',
+    }),
+    # Node.js colocated e2e tests
+    "node_colocated_e2e": ("node-colocated-e2e", {
+        "package.json": '{"scripts":{"test":"vitest"}}',
+        "tsconfig.json": '{"compilerOptions":{}}',
+        "src/api/routes.test.ts": 'describe("routes", () => {})',
+        "src/api/routes.e2e.test.ts": 'describe("routes e2e", () => {})',
+    }),
+    # Node.js colocated integration with .spec convention
+    "node_colocated_spec": ("node-colocated-spec", {
+        "package.json": '{"scripts":{"test":"jest"}}',
+        "tsconfig.json": '{"compilerOptions":{}}',
+        "src/service.spec.ts": 'describe("service", () => {})',
+        "src/service.integration.spec.ts":
+            'describe("service integration", () => {})',
+    }),
+}
 
-def _run_detect(project_dir):
-    """Run detect-test-tiers.sh against a directory."""
-    _, stdout = run_script(DETECT, project_dir)
-    return stdout.strip()
 
 
 def run_tests():
@@ -32,136 +154,16 @@ def run_tests():
     t.header()
 
     with TempDir() as tmp:
-        # ── Setup: Go project with no tests ──
-        go_no_tests = os.path.join(tmp, "go-no-tests")
-        os.makedirs(go_no_tests)
-        write_file(go_no_tests, "go.mod", "module example.com/test\n")
-        write_file(go_no_tests, "main.go",
-                   "package main\n\nfunc main() {}\n")
-
-        # ── Setup: Go project with unit tests only ──
-        go_unit_only = os.path.join(tmp, "go-unit-only")
-        os.makedirs(os.path.join(go_unit_only, "pkg", "handler"))
-        write_file(go_unit_only, "go.mod", "module example.com/test\n")
-        write_file(go_unit_only, "pkg/handler/handler_test.go",
-                   'package handler\n\nimport "testing"\n\n'
-                   'func TestHandleRequest(t *testing.T) {\n'
-                   '\tt.Log("unit test")\n}\n')
-
-        # ── Setup: Go project with integration build tag ──
-        go_integration_tag = os.path.join(tmp, "go-integration-tag")
-        os.makedirs(os.path.join(go_integration_tag, "pkg"))
-        write_file(go_integration_tag, "go.mod", "module example.com/test\n")
-        write_file(go_integration_tag, "pkg/db_test.go",
-                   'package pkg\n\nimport "testing"\n\n'
-                   'func TestDBConnection(t *testing.T) {\n'
-                   '\tt.Log("unit test")\n}\n')
-        write_file(go_integration_tag, "pkg/db_integration_test.go",
-                   '//go:build integration\n\n'
-                   'package pkg\n\nimport "testing"\n\n'
-                   'func TestDBIntegration(t *testing.T) {\n'
-                   '\tt.Log("integration test")\n}\n')
-
-        # ── Setup: Go project with tests/integration/ directory ──
-        go_integration_dir = os.path.join(tmp, "go-integration-dir")
-        os.makedirs(os.path.join(go_integration_dir, "tests", "integration"))
-        write_file(go_integration_dir, "go.mod", "module example.com/test\n")
-        write_file(go_integration_dir, "main_test.go",
-                   'package main\n\nimport "testing"\n\n'
-                   'func TestMain(t *testing.T) {\n'
-                   '\tt.Log("unit test")\n}\n')
-        write_file(go_integration_dir, "tests/integration/api_test.go",
-                   'package integration\n\nimport "testing"\n\n'
-                   'func TestAPI(t *testing.T) {\n'
-                   '\tt.Log("integration test")\n}\n')
-
-        # ── Setup: Go project with e2e build tag ──
-        go_e2e_tag = os.path.join(tmp, "go-e2e-tag")
-        os.makedirs(os.path.join(go_e2e_tag, "test"))
-        write_file(go_e2e_tag, "go.mod", "module example.com/test\n")
-        write_file(go_e2e_tag, "main_test.go",
-                   'package main\n\nimport "testing"\n\n'
-                   'func TestMain(t *testing.T) {\n'
-                   '\tt.Log("unit test")\n}\n')
-        write_file(go_e2e_tag, "test/e2e_test.go",
-                   '//go:build e2e\n\n'
-                   'package test\n\nimport "testing"\n\n'
-                   'func TestE2E(t *testing.T) {\n'
-                   '\tt.Log("e2e test")\n}\n')
-
-        # ── Setup: Go project with envtest (Kubebuilder) ──
-        go_envtest = os.path.join(tmp, "go-envtest")
-        os.makedirs(os.path.join(go_envtest, "internal", "controller"))
-        write_file(go_envtest, "go.mod", "module example.com/test\n")
-        write_file(go_envtest, "internal/controller/suite_test.go",
-                   'package controller\n\nimport (\n\t"testing"\n\n'
-                   '\t"sigs.k8s.io/controller-runtime/pkg/envtest"\n)\n\n'
-                   'var testEnv *envtest.Environment\n\n'
-                   'func TestMain(m *testing.M) {\n'
-                   '\ttestEnv = &envtest.Environment{}\n}\n')
-
-        # ── Setup: Go project with Kind cluster ──
-        go_kind = os.path.join(tmp, "go-kind")
-        os.makedirs(os.path.join(go_kind, "test", "e2e"))
-        write_file(go_kind, "go.mod", "module example.com/test\n")
-        write_file(go_kind, "main_test.go",
-                   'package main\n\nimport "testing"\n\n'
-                   'func TestMain(t *testing.T) {\n'
-                   '\tt.Log("unit test")\n}\n')
-        write_file(go_kind, "test/e2e/cluster_test.go",
-                   'package e2e\n\nimport (\n\t"testing"\n\n'
-                   '\t"sigs.k8s.io/kind/pkg/cluster"\n)\n\n'
-                   'func TestClusterSetup(t *testing.T) {\n'
-                   '\tprovider := cluster.NewProvider()\n'
-                   '\t_ = provider\n}\n')
-
-        # ── Setup: Go project with all three tiers ──
-        go_all_tiers = os.path.join(tmp, "go-all-tiers")
-        os.makedirs(os.path.join(go_all_tiers, "pkg"))
-        os.makedirs(os.path.join(go_all_tiers, "test", "e2e"))
-        write_file(go_all_tiers, "go.mod", "module example.com/test\n")
-        write_file(go_all_tiers, "pkg/handler_test.go",
-                   'package pkg\n\nimport "testing"\n\n'
-                   'func TestHandler(t *testing.T) {\n'
-                   '\tt.Log("unit test")\n}\n')
-        write_file(go_all_tiers, "pkg/handler_integration_test.go",
-                   '//go:build integration\n\n'
-                   'package pkg\n\nimport "testing"\n\n'
-                   'func TestHandlerIntegration(t *testing.T) {\n'
-                   '\tt.Log("integration test")\n}\n')
-        write_file(go_all_tiers, "test/e2e/e2e_test.go",
-                   '//go:build e2e\n\n'
-                   'package e2e\n\nimport "testing"\n\n'
-                   'func TestEndToEnd(t *testing.T) {\n'
-                   '\tt.Log("e2e test")\n}\n')
-
-        # ── Setup: Go project with tests/e2e/ directory (no build tag) ──
-        go_e2e_dir = os.path.join(tmp, "go-e2e-dir")
-        os.makedirs(os.path.join(go_e2e_dir, "tests", "e2e"))
-        write_file(go_e2e_dir, "go.mod", "module example.com/test\n")
-        write_file(go_e2e_dir, "main_test.go",
-                   'package main\n\nimport "testing"\n\n'
-                   'func TestMain(t *testing.T) {\n'
-                   '\tt.Log("unit test")\n}\n')
-        write_file(go_e2e_dir, "tests/e2e/smoke_test.go",
-                   'package e2e\n\nimport "testing"\n\n'
-                   'func TestSmoke(t *testing.T) {\n'
-                   '\tt.Log("e2e test")\n}\n')
-
-        # ── Setup: Go project with only build-tagged tests ──
-        go_only_tagged = os.path.join(tmp, "go-only-tagged")
-        os.makedirs(os.path.join(go_only_tagged, "pkg"))
-        write_file(go_only_tagged, "go.mod", "module example.com/test\n")
-        write_file(go_only_tagged, "pkg/integration_test.go",
-                   '//go:build integration\n\n'
-                   'package pkg\n\nimport "testing"\n\n'
-                   'func TestIntegration(t *testing.T) {\n'
-                   '\tt.Log("integration only")\n}\n')
+        # Each run only reads its own fixture, so all of them run at once
+        # and the sections below assert on the stored output in order
+        projects = build_projects(tmp, PROJECT_SPECS)
+        detected = run_script_each(
+            DETECT, {key: ([path], None) for key, path in projects.items()})
 
         # ═══ Section 1: Go project with no tests ═══
         t.section("Go project with no tests")
 
-        output = _run_detect(go_no_tests)
+        _, output = detected["go_no_tests"]
         t.assert_project_type("detected as go project", output, "go")
         t.assert_tier("no unit tests detected", output, "unit", "False")
         t.assert_tier("no integration tests detected", output, "integration", "False")
@@ -170,7 +172,7 @@ def run_tests():
         # ═══ Section 2: Go project with unit tests only ═══
         t.section("Go project with unit tests only")
 
-        output = _run_detect(go_unit_only)
+        _, output = detected["go_unit_only"]
         t.assert_tier("unit tests detected", output, "unit", "True")
         t.assert_tier("no integration tests", output, "integration", "False")
         t.assert_tier("no e2e tests", output, "e2e", "False")
@@ -178,7 +180,7 @@ def run_tests():
         # ═══ Section 3: Go integration via build tag ═══
         t.section("Go integration tests (build tag)")
 
-        output = _run_detect(go_integration_tag)
+        _, output = detected["go_integration_tag"]
         t.assert_tier("unit tests detected", output, "unit", "True")
         t.assert_tier("integration detected via build tag", output, "integration", "True")
         t.assert_tier("no e2e tests", output, "e2e", "False")
@@ -186,7 +188,7 @@ def run_tests():
         # ═══ Section 4: Go integration via directory convention ═══
         t.section("Go integration tests (directory convention)")
 
-        output = _run_detect(go_integration_dir)
+        _, output = detected["go_integration_dir"]
         t.assert_tier("unit tests detected", output, "unit", "True")
         t.assert_tier("integration detected via directory", output, "integration", "True")
         t.assert_tier("no e2e tests", output, "e2e", "False")
@@ -194,7 +196,7 @@ def run_tests():
         # ═══ Section 5: Go e2e via build tag ═══
         t.section("Go e2e tests (build tag)")
 
-        output = _run_detect(go_e2e_tag)
+        _, output = detected["go_e2e_tag"]
         t.assert_tier("unit tests detected", output, "unit", "True")
         t.assert_tier("no integration tests", output, "integration", "False")
         t.assert_tier("e2e detected via build tag", output, "e2e", "True")
@@ -202,20 +204,20 @@ def run_tests():
         # ═══ Section 6: Go e2e via envtest ═══
         t.section("Go e2e tests (envtest)")
 
-        output = _run_detect(go_envtest)
+        _, output = detected["go_envtest"]
         t.assert_tier("e2e detected via envtest import", output, "e2e", "True")
 
         # ═══ Section 7: Go e2e via Kind ═══
         t.section("Go e2e tests (Kind)")
 
-        output = _run_detect(go_kind)
+        _, output = detected["go_kind"]
         t.assert_tier("unit tests detected", output, "unit", "True")
         t.assert_tier("e2e detected via Kind import", output, "e2e", "True")
 
         # ═══ Section 8: Go e2e via tests/e2e/ directory ═══
         t.section("Go e2e tests (directory convention)")
 
-        output = _run_detect(go_e2e_dir)
+        _, output = detected["go_e2e_dir"]
         t.assert_tier("unit tests detected", output, "unit", "True")
         t.assert_tier("no integration tests", output, "integration", "False")
         t.assert_tier("e2e detected via directory", output, "e2e", "True")
@@ -223,7 +225,7 @@ def run_tests():
         # ═══ Section 9: Go project with all tiers ═══
         t.section("Go project with all tiers")
 
-        output = _run_detect(go_all_tiers)
+        _, output = detected["go_all_tiers"]
         t.assert_tier("unit tests detected", output, "unit", "True")
         t.assert_tier("integration tests detected", output, "integration", "True")
         t.assert_tier("e2e tests detected", output, "e2e", "True")
@@ -231,7 +233,7 @@ def run_tests():
         # ═══ Section 10: Go project with only tagged tests ═══
         t.section("Go project with only tagged tests (no unit)")
 
-        output = _run_detect(go_only_tagged)
+        _, output = detected["go_only_tagged"]
         t.assert_tier("no unit tests (all files have build tags)", output, "unit", "False")
         t.assert_tier("integration detected via build tag", output, "integration", "True")
         t.assert_tier("no e2e tests", output, "e2e", "False")
@@ -239,16 +241,7 @@ def run_tests():
         # ═══ Section 11: Node.js regression ═══
         t.section("Node.js regression")
 
-        node_proj = os.path.join(tmp, "node-regression")
-        os.makedirs(os.path.join(node_proj, "tests", "unit"))
-        os.makedirs(os.path.join(node_proj, "tests", "integration"))
-        write_file(node_proj, "package.json", '{"scripts":{"test":"vitest"}}')
-        write_file(node_proj, "tests/unit/example.test.js",
-                   'describe("unit", () => {})')
-        write_file(node_proj, "tests/integration/api.test.js",
-                   'describe("int", () => {})')
-
-        output = _run_detect(node_proj)
+        _, output = detected["node_proj"]
         t.assert_project_type("Node.js still detected correctly", output, "node-javascript")
         t.assert_tier("Node.js unit still works", output, "unit", "True")
         t.assert_tier("Node.js integration still works", output, "integration", "True")
@@ -257,19 +250,7 @@ def run_tests():
         # ═══ Section 12: Node.js colocated integration tests ═══
         t.section("Node.js colocated integration tests (*.integration.test.ts)")
 
-        node_colocated_int = os.path.join(tmp, "node-colocated-integration")
-        os.makedirs(os.path.join(node_colocated_int, "src", "pipeline"))
-        write_file(node_colocated_int, "package.json",
-                   '{"scripts":{"test":"vitest"}}')
-        write_file(node_colocated_int, "tsconfig.json", '{"compilerOptions":{}}')
-        write_file(node_colocated_int, "src/pipeline/runner.test.ts",
-                   'describe("runner", () => {})')
-        write_file(node_colocated_int, "src/pipeline/runner.integration.test.ts",
-                   'describe("runner integration", () => {})')
-        write_file(node_colocated_int, "src/pipeline/storage.integration.test.ts",
-                   'describe("storage integration", () => {})')
-
-        output = _run_detect(node_colocated_int)
+        _, output = detected["node_colocated_int"]
         t.assert_project_type("detected as node-typescript", output, "node-typescript")
         t.assert_tier("unit tests detected", output, "unit", "True")
         t.assert_tier("integration detected via colocated files", output, "integration", "True")
@@ -278,17 +259,7 @@ def run_tests():
         # ═══ Section 13: Node.js colocated e2e tests ═══
         t.section("Node.js colocated e2e tests (*.e2e.test.ts)")
 
-        node_colocated_e2e = os.path.join(tmp, "node-colocated-e2e")
-        os.makedirs(os.path.join(node_colocated_e2e, "src", "api"))
-        write_file(node_colocated_e2e, "package.json",
-                   '{"scripts":{"test":"vitest"}}')
-        write_file(node_colocated_e2e, "tsconfig.json", '{"compilerOptions":{}}')
-        write_file(node_colocated_e2e, "src/api/routes.test.ts",
-                   'describe("routes", () => {})')
-        write_file(node_colocated_e2e, "src/api/routes.e2e.test.ts",
-                   'describe("routes e2e", () => {})')
-
-        output = _run_detect(node_colocated_e2e)
+        _, output = detected["node_colocated_e2e"]
         t.assert_project_type("detected as node-typescript", output, "node-typescript")
         t.assert_tier("unit tests detected", output, "unit", "True")
         t.assert_tier("no integration tests", output, "integration", "False")
@@ -297,17 +268,7 @@ def run_tests():
         # ═══ Section 14: Node.js colocated integration with .spec convention ═══
         t.section("Node.js colocated integration tests (.spec convention)")
 
-        node_colocated_spec = os.path.join(tmp, "node-colocated-spec")
-        os.makedirs(os.path.join(node_colocated_spec, "src"))
-        write_file(node_colocated_spec, "package.json",
-                   '{"scripts":{"test":"jest"}}')
-        write_file(node_colocated_spec, "tsconfig.json", '{"compilerOptions":{}}')
-        write_file(node_colocated_spec, "src/service.spec.ts",
-                   'describe("service", () => {})')
-        write_file(node_colocated_spec, "src/service.integration.spec.ts",
-                   'describe("service integration", () => {})')
-
-        output = _run_detect(node_colocated_spec)
+        _, output = detected["node_colocated_spec"]
         t.assert_project_type("detected as node-typescript", output, "node-typescript")
         t.assert_tier("unit tests detected via .spec", output, "unit", "True")
         t.assert_tier("integration detected via .integration.spec", output, "integration", "True")
@@ -3,19 +3,31 @@
 Provides:
 - JSON builders: make_hook_input() — in-memory, no subprocess
 - JSON parsing: json_field() — in-memory, no subprocess
-- Hook runner: run_hook() — subprocess.run with stdin piping
-- Script runner: run_script() — subprocess.run with env control
-- Fixture helpers: TempDir context manager, write_file(), setup_git_repo()
+- Hook runner: run_hook() — subprocess.run with stdin piping;
+  run_hooks() — several hooks concurrently via asyncio subprocesses
+- Script runner: run_script() — subprocess.run with env control;
+  run_scripts()/run_script_each() — several scripts concurrently
+- Fixture helpers: TempDir context manager, write_file(), write_files(),
+  build_projects(), path_without(), setup_git_repo(), session_repo()
 - Assertions: TestResults class with assert_allow, assert_deny, etc.
+  (all hook assertions dispatch through assert_hook() by Kind)
 - Reporter: Colored PASS/FAIL output matching current terminal format
 """
 
+import atexit
+import contextlib
+import enum
+import functools
+import io
 import json
 import os
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import shutil
+import weakref
 
 # ── Colors ──────────────────────────────────────────────────────────
 
@@ -43,8 +55,12 @@ def script_path(name):
 
 # ── JSON Builders ───────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
 def make_hook_input(command, cwd="/tmp/test-project"):
-    """Build PreToolUse hook event JSON — in-memory, no subprocess."""
+    """Build PreToolUse hook event JSON — in-memory, no subprocess.
+
+    Cached: suites repeat the same (command, cwd) pairs many times.
+    """
     return json.dumps({
         "tool_name": "Bash",
         "tool_input": {"command": command},
@@ -54,6 +70,25 @@ def make_hook_input(command, cwd="/tmp/test-project"):
 
 # ── JSON Parsing ────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=64)
+def _parse_json(json_str):
+    """Parse json_str, or return None if it is not valid JSON.
+
+    Cached: sections run several field assertions against one output, so
+    each output is parsed once. Callers only read the result.
+    """
+    try:
+        return json.loads(json_str)
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _field_keys(field_path):
+    """Split a dotted field path into its keys (cached; suites reuse a few)."""
+    return tuple(field_path.split("."))
+
+
 def json_field(json_str, field_path):
     """Extract a nested field from JSON using dot-notation path.
 
@@ -61,16 +96,18 @@ def json_field(json_str, field_path):
     if the field is missing or None.
     """
     try:
-        data = json.loads(json_str)
-    except (json.JSONDecodeError, TypeError):
+        val = _parse_json(json_str)
+    except TypeError:
+        # Unhashable input cannot be cached (or parsed)
         return ""
-    keys = field_path.split(".")
-    val = data
-    for k in keys:
-        if isinstance(val, dict) and k in val:
+    # Index straight through; a missing key (KeyError) or a non-object
+    # along the path (TypeError: None, str, list, number) means "no field".
+    # Not dict.get(...) or "": that would turn False and 0 into "".
+    try:
+        for k in _field_keys(field_path):
             val = val[k]
-        else:
-            return ""
+    except (KeyError, TypeError):
+        return ""
     if val is None:
         return ""
     return str(val)
@@ -78,34 +115,133 @@ def json_field(json_str, field_path):
 
 # ── Subprocess Runners ──────────────────────────────────────────────
 
+# Hooks are fork/exec and I/O bound, so run_hooks() oversubscribes the CPUs.
+# VERIFY_HOOK_CONCURRENCY overrides it; run_tests.py sets it in its worker
+# processes so the pool as a whole stays near this budget.
+HOOK_CONCURRENCY = (int(os.environ.get("VERIFY_HOOK_CONCURRENCY") or 0)
+                    or (os.cpu_count() or 1) * 2)
+
+
 def run_hook(hook, json_input):
     """Run a hook script, piping json_input to stdin.
 
     Returns (exit_code, stdout).
     """
+    # Only stdout is inspected, so stderr is neither piped nor decoded
     result = subprocess.run(
         [hook],
         input=json_input,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
     )
     return result.returncode, result.stdout
 
 
+def _run_concurrently(calls, combined=False):
+    """Run several commands concurrently; the shared core of run_hooks/run_scripts.
+
+    calls is a list of (argv, stdin_bytes, env) triples: stdin_bytes None
+    inherits stdin, env None inherits the environment. stderr is discarded,
+    or merged into stdout with combined=True. Returns a list of
+    (exit_code, stdout) in the same order. At most HOOK_CONCURRENCY
+    commands run at once.
+    """
+    # Imported here: asyncio is most of the harness's import time, and
+    # most suites never run commands concurrently
+    import asyncio
+
+    stderr = asyncio.subprocess.STDOUT if combined else asyncio.subprocess.DEVNULL
+
+    async def run_one(limit, argv, stdin_bytes, env):
+        async with limit:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=None if stdin_bytes is None else asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=stderr,
+                env=env,
+            )
+            stdout, _ = await proc.communicate(stdin_bytes)
+            return proc.returncode, stdout.decode(errors="replace")
+
+    async def run_all():
+        limit = asyncio.Semaphore(HOOK_CONCURRENCY)
+        return await asyncio.gather(
+            *(run_one(limit, argv, data, env) for argv, data, env in calls))
+
+    if not calls:
+        return []
+    return asyncio.run(run_all())
+
+
+def run_hooks(calls):
+    """Run several hooks concurrently, piping each its json_input.
+
+    calls is a list of (hook, json_input) pairs. Returns a list of
+    (exit_code, stdout) in the same order.
+    """
+    return _run_concurrently(
+        [([hook], json_input.encode(), None) for hook, json_input in calls])
+
+
+def run_scripts(calls, combined=False):
+    """Run several utility scripts concurrently.
+
+    calls is a list of (script, args, env) triples; env may be None to
+    inherit the environment. Returns a list of (exit_code, stdout) in the
+    same order. With combined=True stderr is merged into stdout, as in
+    run_script_combined().
+    """
+    return _run_concurrently(
+        [([script, *args], None, env) for script, args, env in calls], combined)
+
+
+def run_script_each(script, runs, combined=False):
+    """Run script once per named fixture, concurrently.
+
+    runs maps a name to (args, env). Returns a dict of name ->
+    (exit_code, stdout), for suites that run every fixture up front and
+    assert on the stored results section by section.
+    """
+    results = run_scripts(
+        [(script, args, env) for args, env in runs.values()], combined)
+    return dict(zip(runs, results))
+
+
+def _capture_file():
+    """Return an anonymous binary file for a child's output.
+
+    Uses memfd_create where available (an in-memory file, no disk path),
+    otherwise an unlinked temporary file.
+    """
+    if hasattr(os, "memfd_create"):
+        return os.fdopen(os.memfd_create("run-script-output"), "w+b")
+    return tempfile.TemporaryFile()
+
+
+def _run_captured(cmd, stderr, env, cwd):
+    """Run cmd with stdout written to a capture file; return (code, text).
+
+    The child writes straight into the file, so no pipe has to be drained
+    while it runs; the output is read back once after it exits. Decoded
+    with universal newlines, like text=True.
+    """
+    with _capture_file() as out:
+        result = subprocess.run(cmd, stdout=out, stderr=stderr, env=env, cwd=cwd)
+        out.seek(0)
+        data = out.read()
+    text = data.decode(errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+    return result.returncode, text
+
+
 def run_script(script, *args, env=None, cwd=None):
     """Run a utility script with positional args.
 
     Returns (exit_code, stdout).
     """
-    cmd = [script, *args]
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        cwd=cwd,
-    )
-    return result.returncode, result.stdout
+    # Only stdout is returned, so stderr is discarded rather than captured
+    return _run_captured([script, *args], subprocess.DEVNULL, env, cwd)
 
 
 def run_script_combined(script, *args, env=None, cwd=None):
@@ -113,80 +249,223 @@ def run_script_combined(script, *args, env=None, cwd=None):
 
     Equivalent to bash's 2>&1 redirection. Returns (exit_code, output).
     """
-    cmd = [script, *args]
-    result = subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        env=env,
-        cwd=cwd,
-    )
-    return result.returncode, result.stdout
+    return _run_captured([script, *args], subprocess.STDOUT, env, cwd)
 
 
 # ── Fixture Helpers ─────────────────────────────────────────────────
 
+def _tmpdir_base():
+    """Parent for test temp dirs: VERIFY_TMPDIR if set, else tempfile's default."""
+    return os.environ.get("VERIFY_TMPDIR") or None
+
+
 class TempDir:
-    """Context manager providing a temporary directory with auto-cleanup."""
+    """Context manager providing a temporary directory with auto-cleanup.
+
+    cleanup chooses when the directory is removed:
+    - "sync": on block exit (default)
+    - "atexit": when the process exits
+    - "background": on block exit, in a daemon thread (joined at process
+      exit, for at most BACKGROUND_JOIN_TIMEOUT seconds)
+    The default can be changed with VERIFY_TEMPDIR_CLEANUP for local runs;
+    CI should keep "sync". VERIFY_TMPDIR sets the parent directory (for
+    example a tmpfs such as /dev/shm) without changing TMPDIR for the
+    scripts under test; it must allow executing files.
+    """
+
+    CLEANUP_MODES = ("sync", "atexit", "background")
+
+    # Seconds to wait at exit for background removals still running; daemon
+    # threads are otherwise killed mid-rmtree and leave the directory behind
+    BACKGROUND_JOIN_TIMEOUT = 5.0
 
-    def __init__(self):
+    _background = []
+
+    def __init__(self, cleanup=None):
         self.path = None
+        self.cleanup = cleanup or os.environ.get("VERIFY_TEMPDIR_CLEANUP", "sync")
+        if self.cleanup not in self.CLEANUP_MODES:
+            raise ValueError(f"Unknown TempDir cleanup mode: {self.cleanup}")  # noqa: TRY003
 
     def __enter__(self):
-        self.path = tempfile.mkdtemp()
+        self.path = tempfile.mkdtemp(dir=_tmpdir_base())
         return self.path
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.path and os.path.exists(self.path):
-            shutil.rmtree(self.path)
+        if not self.path:
+            return False
+        if self.cleanup == "atexit":
+            atexit.register(shutil.rmtree, self.path, ignore_errors=True)
+        elif self.cleanup == "background":
+            thread = threading.Thread(
+                target=shutil.rmtree, args=(self.path,),
+                kwargs={"ignore_errors": True}, daemon=True,
+            )
+            if not TempDir._background:
+                atexit.register(TempDir._join_background)
+            TempDir._background.append(thread)
+            thread.start()
+        else:
+            # rmtree already walks by directory fd; a tree the test removed
+            # itself is fine, so there is no separate existence check
+            with contextlib.suppress(FileNotFoundError):
+                shutil.rmtree(self.path)
         return False
 
+    @classmethod
+    def _join_background(cls):
+        """Wait (bounded overall) for background removals to finish."""
+        deadline = time.monotonic() + cls.BACKGROUND_JOIN_TIMEOUT
+        for thread in cls._background:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        cls._background.clear()
+
+
+def write_file(base_dir, relative_path, content="", mode=0o666):
+    """Write a file at base_dir/relative_path, creating parent dirs as needed.
 
-def write_file(base_dir, relative_path, content=""):
-    """Write a file at base_dir/relative_path, creating parent dirs as needed."""
+    content may be str (written as UTF-8) or bytes. mode applies when the
+    file is created, minus the umask; the default matches what open() uses.
+    """
     full_path = os.path.join(base_dir, relative_path)
     parent = os.path.dirname(full_path)
     if parent:
         os.makedirs(parent, exist_ok=True)
-    with open(full_path, "w") as f:
-        f.write(content)
+    # Raw fd write: fixtures are tiny, so skip the buffered text-IO layer
+    fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        _write_fd(fd, content)
+    finally:
+        os.close(fd)
     return full_path
 
 
+def write_executable(base_dir, relative_path, content=""):
+    """Write an executable script, created with mode 0o755 (no separate chmod)."""
+    return write_file(base_dir, relative_path, content, mode=0o755)
+
+
+def _write_fd(fd, content):
+    """Write all of content (str as UTF-8, or bytes) to fd."""
+    data = content.encode() if isinstance(content, str) else content
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def write_files(base_dir, files):
+    """Write several files under base_dir, creating it and parent dirs.
+
+    files maps relative path -> content (str or bytes). base_dir is opened
+    once and each file is created relative to that descriptor, so the
+    directory path is resolved once rather than per file. Returns base_dir.
+    """
+    os.makedirs(base_dir, exist_ok=True)
+    dir_fd = os.open(base_dir, os.O_RDONLY | os.O_DIRECTORY)
+    # Sibling files share a parent; create each parent once per call
+    made = {""}
+    try:
+        for rel, content in files.items():
+            parent = os.path.dirname(rel)
+            if parent not in made:
+                os.makedirs(os.path.join(base_dir, parent), exist_ok=True)
+                made.add(parent)
+            # 0o666 minus the umask, as write_file() and open() create files
+            fd = os.open(rel, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666,
+                         dir_fd=dir_fd)
+            try:
+                _write_fd(fd, content)
+            finally:
+                os.close(fd)
+    finally:
+        os.close(dir_fd)
+    return base_dir
+
+
+
+def build_projects(base_dir, specs):
+    """Create a table of fixture projects under base_dir.
+
+    specs maps key -> (directory name, {relative path: content}) with an
+    optional third item listing empty dirs to create, for layouts detected
+    by directory even when they hold no files. Returns key -> project path.
+    """
+    projects = {}
+    for key, (name, files, *rest) in specs.items():
+        path = write_files(os.path.join(base_dir, name), files)
+        for d in (rest[0] if rest else ()):
+            os.makedirs(os.path.join(path, d), exist_ok=True)
+        projects[key] = path
+    return projects
+
+
+def path_without(base_dir, name):
+    """Return PATH with the executable name hidden and everything else kept.
+
+    Each PATH directory holding name is swapped for a shadow directory
+    under base_dir that symlinks every other entry, so commands installed
+    alongside it (go, npm, jq in /usr/local/bin or Homebrew) stay found.
+    """
+    dirs = []
+    for i, d in enumerate(os.environ.get("PATH", "").split(os.pathsep)):
+        target = os.path.join(d, name)
+        if d and os.path.isfile(target) and os.access(target, os.X_OK):
+            shadow = os.path.join(base_dir, f"path-shadow-{i}")
+            os.makedirs(shadow)
+            for entry in os.listdir(d):
+                if entry != name:
+                    os.symlink(os.path.join(d, entry), os.path.join(shadow, entry))
+            d = shadow
+        dirs.append(d)
+    return os.pathsep.join(dirs)
+
 def setup_git_repo(path, branch="main"):
     """Initialize a git repo at path with an initial commit.
 
     Sets local git config for test isolation (no reliance on global config).
     Returns the repo path.
     """
+    # An empty --template skips copying the sample hooks and info/ files
+    # from the system template dir; no test relies on them
+    # Neither git call's output is used (check=True still surfaces a
+    # failure), so both streams go to /dev/null instead of pipes
     subprocess.run(
-        ["git", "init", "-b", branch, "--quiet"],
-        cwd=path,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=path,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
+        ["git", "init", "-b", branch, "--quiet", "--template="],
         cwd=path,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         check=True,
     )
+    # Append the identity to .git/config directly rather than spawning
+    # git config twice; init has already written the file. Auto-gc and
+    # reflog writes are switched off too, since no test reads either.
+    with open(os.path.join(path, ".git", "config"), "a") as f:
+        f.write("[user]\n\temail = test@test.com\n\tname = Test\n"
+                "[gc]\n\tauto = 0\n"
+                "[core]\n\tlogAllRefUpdates = false\n")
     subprocess.run(
         ["git", "commit", "--allow-empty", "-m", "initial", "--quiet"],
         cwd=path,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         check=True,
     )
     return path
 
 
+@functools.lru_cache(maxsize=None)
+def session_repo(branch="main"):
+    """Return a git repo created once per process and shared between callers.
+
+    Only for tests that never modify the repo (no commits, checkouts or
+    files written inside it); anything that mutates state should build its
+    own with setup_git_repo(). Removed when the process exits.
+    """
+    path = tempfile.mkdtemp(prefix="verify-test-session-", dir=_tmpdir_base())
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return setup_git_repo(path, branch=branch)
+
+
 def make_executable(path):
     """Make a file executable (chmod +x equivalent)."""
     os.chmod(path, os.stat(path).st_mode | 0o111)
@@ -194,126 +473,204 @@ def make_executable(path):
 
 # ── Test Results & Assertions ───────────────────────────────────────
 
+class Kind(enum.Enum):
+    """Expected outcome of a hook, for TestResults.assert_hook()."""
+    ALLOW = "allow"
+    DENY = "deny"
+    DENY_CONTAINS = "deny_contains"
+    SILENT = "silent"
+    ALLOW_WARN = "allow_warn"
+    ALLOW_NO_REASON = "allow_no_reason"
+
+
+def _contains(output, text):
+    return text.lower() in output.lower()
+
+
+# Kind -> (check(output, text) on an exit-0 run, expectation for failures).
+# {text} in the expectation is the fragment passed to the assertion.
+_HOOK_CHECKS = {
+    Kind.ALLOW: (
+        lambda output, text: '"deny"' not in output,
+        "allow (silent passthrough)",
+    ),
+    Kind.DENY: (
+        lambda output, text: '"deny"' in output,
+        "deny with JSON output",
+    ),
+    Kind.DENY_CONTAINS: (
+        lambda output, text: '"deny"' in output and _contains(output, text),
+        "deny containing '{text}'",
+    ),
+    Kind.SILENT: (
+        lambda output, text: output.strip() == "",
+        "silent passthrough (no output)",
+    ),
+    Kind.ALLOW_WARN: (
+        lambda output, text: '"allow"' in output and _contains(output, text),
+        "allow with warning containing '{text}'",
+    ),
+    Kind.ALLOW_NO_REASON: (
+        lambda output, text: ('"allow"' in output
+                              and _contains(output, text)
+                              and "permissionDecisionReason" not in output),
+        "allow with warning in additionalContext only "
+        "(no permissionDecisionReason)",
+    ),
+}
+
+
+def _write_buffer(buf):
+    """Write a TestResults buffer to stdout and empty it."""
+    sys.stdout.write(buf.getvalue())
+    buf.seek(0)
+    buf.truncate()
+
+
 class TestResults:
     """Tracks pass/fail counts and provides assertion methods.
 
-    Each assertion method increments counters and prints colored output.
+    Each assertion method increments counters and records colored output.
+    Output is buffered and written to stdout once per section and at the
+    summary, rather than one write per assertion. Whatever is still
+    buffered when the instance is collected (or at process exit) is written
+    then, so a module that raises mid-section keeps its results.
     """
 
+    # Fixed attribute set: slot access is cheaper than instance-dict lookups
+    # on the per-assertion counters and buffer
+    __slots__ = ("suite_name", "passed", "failed", "_pending", "_buf",
+                 "__weakref__")
+
     def __init__(self, suite_name="tests"):
         self.suite_name = suite_name
         self.passed = 0
         self.failed = 0
-        self.total = 0
+        # Hook assertions queued by parallel(); None when running inline
+        self._pending = None
+        self._buf = io.StringIO()
+        # Holds only the buffer, not self, so it never keeps the instance
+        # alive; runs when the instance is collected or at exit
+        weakref.finalize(self, _write_buffer, self._buf)
+
+    @property
+    def total(self):
+        """Number of assertions run so far (derived, not counted separately)."""
+        return self.passed + self.failed
+
+    def _emit(self, line=""):
+        self._buf.write(line + "\n")
+
+    def _flush(self):
+        _write_buffer(self._buf)
 
     def _pass(self, description):
+        # The common path of every assertion, so the buffer write is inlined
         self.passed += 1
-        self.total += 1
-        print(f"{GREEN}  PASS{NC} {description}")
+        self._buf.write(f"{GREEN}  PASS{NC} {description}\n")
 
     def _fail(self, description, details=""):
         self.failed += 1
-        self.total += 1
-        print(f"{RED}  FAIL{NC} {description}")
+        self._emit(f"{RED}  FAIL{NC} {description}")
         if details:
             for line in details.strip().split("\n"):
-                print(f"       {line}")
+                self._emit(f"       {line}")
 
     def section(self, title):
-        """Print a section header."""
-        print(f"\n{YELLOW}--- {title} ---{NC}")
+        """Print a section header, flushing the previous section's results."""
+        self._flush()
+        self._emit(f"\n{YELLOW}--- {title} ---{NC}")
 
     def header(self):
         """Print the suite header."""
-        print(f"\n{YELLOW}=== {self.suite_name} ==={NC}\n")
+        self._emit(f"\n{YELLOW}=== {self.suite_name} ==={NC}\n")
 
     def summary(self):
         """Print results summary. Returns exit code (0=pass, 1=fail)."""
-        print()
-        print(f"{YELLOW}=== Results ==={NC}")
-        print(
+        self._emit()
+        self._emit(f"{YELLOW}=== Results ==={NC}")
+        self._emit(
             f"  Total: {self.total} | "
             f"{GREEN}Passed: {self.passed}{NC} | "
             f"{RED}Failed: {self.failed}{NC}"
         )
-        print()
+        self._emit()
+        self._flush()
         return 0 if self.failed == 0 else 1
 
+    def results(self):
+        """Flush buffered output and return (passed, failed, total).
+
+        For suites that end without summary().
+        """
+        self._flush()
+        return self.passed, self.failed, self.total
+
     # ── Hook assertions (for PreToolUse hooks) ──
 
-    def assert_allow(self, description, hook, json_input):
-        """Assert hook allows the input (exit 0, no 'deny' in output)."""
+    @contextlib.contextmanager
+    def parallel(self):
+        """Run the hook assertions made inside the block concurrently.
+
+        Assertions are queued, then every hook is launched at once when the
+        block exits and the results are reported in the order they were
+        made. Only hook assertions belong inside, and only ones whose
+        fixtures do not change between them.
+        """
+        self._pending = []
+        try:
+            yield self
+        finally:
+            pending, self._pending = self._pending, None
+        results = run_hooks([(hook, json_input) for _, _, hook, json_input, _ in pending])
+        for (kind, description, _, _, text), (exit_code, output) in zip(pending, results):
+            self._check_hook(kind, description, exit_code, output, text)
+
+    def assert_hook(self, kind, description, hook, json_input, text=None):
+        """Assert a hook outcome of the given Kind; text is the expected fragment.
+
+        Every hook assertion goes through here. The assert_* methods below
+        are named shorthands for each kind.
+        """
+        if self._pending is not None:
+            self._pending.append((kind, description, hook, json_input, text))
+            return
         exit_code, output = run_hook(hook, json_input)
-        if exit_code == 0 and '"deny"' not in output:
+        self._check_hook(kind, description, exit_code, output, text)
+
+    def _check_hook(self, kind, description, exit_code, output, text):
+        ok, expectation = _HOOK_CHECKS[kind]
+        if exit_code == 0 and ok(output, text):
             self._pass(description)
         else:
             self._fail(description, (
-                "Expected: allow (silent passthrough)\n"
+                f"Expected: {expectation.format(text=text)}\n"
                 f"Got exit={exit_code}, output={output}"
             ))
 
+    def assert_allow(self, description, hook, json_input):
+        """Assert hook allows the input (exit 0, no 'deny' in output)."""
+        self.assert_hook(Kind.ALLOW, description, hook, json_input)
+
     def assert_deny(self, description, hook, json_input):
         """Assert hook denies the input (exit 0, 'deny' in output)."""
-        exit_code, output = run_hook(hook, json_input)
-        if exit_code == 0 and '"deny"' in output:
-            self._pass(description)
-        else:
-            self._fail(description, (
-                "Expected: deny with JSON output\n"
-                f"Got exit={exit_code}, output={output}"
-            ))
+        self.assert_hook(Kind.DENY, description, hook, json_input)
 
     def assert_deny_contains(self, description, hook, json_input, fragment):
         """Assert hook denies and output contains fragment (case-insensitive)."""
-        exit_code, output = run_hook(hook, json_input)
-        if (exit_code == 0
-                and '"deny"' in output
-                and fragment.lower() in output.lower()):
-            self._pass(description)
-        else:
-            self._fail(description, (
-                f"Expected: deny containing '{fragment}'\n"
-                f"Got exit={exit_code}, output={output}"
-            ))
+        self.assert_hook(Kind.DENY_CONTAINS, description, hook, json_input, fragment)
 
     def assert_silent(self, description, hook, json_input):
         """Assert hook exits 0 with no output (silent passthrough)."""
-        exit_code, output = run_hook(hook, json_input)
-        if exit_code == 0 and output.strip() == "":
-            self._pass(description)
-        else:
-            self._fail(description, (
-                "Expected: silent passthrough (no output)\n"
-                f"Got exit={exit_code}, output={output}"
-            ))
+        self.assert_hook(Kind.SILENT, description, hook, json_input)
 
     def assert_allow_with_warning(self, description, hook, json_input, fragment):
         """Assert hook allows with 'allow' in output and fragment present (case-insensitive)."""
-        exit_code, output = run_hook(hook, json_input)
-        if (exit_code == 0
-                and '"allow"' in output
-                and fragment.lower() in output.lower()):
-            self._pass(description)
-        else:
-            self._fail(description, (
-                f"Expected: allow with warning containing '{fragment}'\n"
-                f"Got exit={exit_code}, output={output}"
-            ))
+        self.assert_hook(Kind.ALLOW_WARN, description, hook, json_input, fragment)
 
     def assert_allow_no_reason(self, description, hook, json_input, fragment):
         """Assert hook allows with fragment in output but no permissionDecisionReason."""
-        exit_code, output = run_hook(hook, json_input)
-        if (exit_code == 0
-                and '"allow"' in output
-                and fragment.lower() in output.lower()
-                and "permissionDecisionReason" not in output):
-            self._pass(description)
-        else:
-            self._fail(description, (
-                f"Expected: allow with warning in additionalContext only "
-                f"(no permissionDecisionReason)\n"
-                f"Got exit={exit_code}, output={output}"
-            ))
+        self.assert_hook(Kind.ALLOW_NO_REASON, description, hook, json_input, fragment)
 
     # ── Field assertions (for script JSON output) ──
 
@@ -17,18 +17,18 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from test_harness import (
-    TestResults, script_path, run_script_combined, TempDir,
-    setup_git_repo, write_file, make_executable,
+    TestResults, script_path, run_script_each, TempDir,
+    setup_git_repo, write_file, write_files, write_executable, path_without,
 )
 
 LINT_CHANGED = script_path("lint-changed.sh")
 
 
 def _git(repo, *args):
-    """Run a git command in a repo."""
+    """Run a git command in a repo; its output is not needed by any caller."""
     return subprocess.run(
         ["git"] + list(args),
-        cwd=repo, capture_output=True, text=True,
+        cwd=repo, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
 
@@ -38,51 +38,64 @@ def _setup_fake_bins(temp_base):
     os.makedirs(fake_bin, exist_ok=True)
 
     # Fake golangci-lint that succeeds
-    write_file(temp_base, "fake-bin/golangci-lint",
+    write_executable(temp_base, "fake-bin/golangci-lint",
         '#!/usr/bin/env bash\n'
         'echo "GOLANGCI_ARGS: $*" >> "${GOLANGCI_LOG:-/dev/null}"\n'
         'echo "golangci-lint: no issues found"\n'
         'exit 0\n'
     )
-    make_executable(os.path.join(fake_bin, "golangci-lint"))
 
     # Fake npx (for ESLint) that succeeds
-    write_file(temp_base, "fake-bin/npx",
+    write_executable(temp_base, "fake-bin/npx",
         '#!/usr/bin/env bash\n'
         'echo "npx: $*"\n'
         'exit 0\n'
     )
-    make_executable(os.path.join(fake_bin, "npx"))
 
     # Fake golangci-lint that fails (in separate directory)
     fail_bin = os.path.join(temp_base, "fail-bin")
     os.makedirs(fail_bin, exist_ok=True)
-    write_file(temp_base, "fail-bin/golangci-lint",
+    write_executable(temp_base, "fail-bin/golangci-lint",
         '#!/usr/bin/env bash\n'
         'echo "GOLANGCI_ARGS: $*" >> "${GOLANGCI_LOG:-/dev/null}"\n'
         'echo "main.go:10: exported function Foo should have comment (golint)"\n'
         'exit 1\n'
     )
-    make_executable(os.path.join(fail_bin, "golangci-lint"))
 
     return fake_bin, fail_bin
 
 
+def _make_go_template(temp_base):
+    """Create a repo with go.mod committed, to be copied per section.
+
+    Several sections start from exactly this state; copying the finished
+    repo is in-process file copies instead of git init + add + commit
+    spawns for each of them.
+    """
+    template = os.path.join(temp_base, "template-go")
+    os.makedirs(template)
+    setup_git_repo(template)
+    write_file(template, "go.mod", "module example.com/test\n")
+    _git(template, "add", "go.mod")
+    _git(template, "commit", "-q", "-m", "add go.mod")
+    return template
+
+
+def _copy_repo(template, temp_base, name):
+    """Copy a template repo to temp_base/name and return the new path."""
+    return shutil.copytree(template, os.path.join(temp_base, name),
+                           symlinks=True)
+
+
 def _path_with(directory):
     """Return PATH with directory prepended."""
     return directory + ":" + os.environ.get("PATH", "")
 
 
-def _path_without_golangci_lint(fake_bin):
-    """Return PATH with fake_bin and any real golangci-lint directory removed."""
-    current = os.environ.get("PATH", "")
-    dirs = current.split(":")
-    dirs = [d for d in dirs if d != fake_bin]
-    real = shutil.which("golangci-lint")
-    if real:
-        real_dir = os.path.dirname(real)
-        dirs = [d for d in dirs if d != real_dir]
-    return ":".join(dirs)
+def _read(path):
+    """Return the contents of a text file."""
+    with open(path) as f:
+        return f.read()
 
 
 def run_tests():
@@ -92,28 +105,24 @@ def run_tests():
     with TempDir() as temp_base:
         fake_bin, fail_bin = _setup_fake_bins(temp_base)
         path_with_lint = _path_with(fake_bin)
-        path_without_lint = _path_without_golangci_lint(fake_bin)
+        path_without_lint = path_without(temp_base, "golangci-lint")
+        go_template = _make_go_template(temp_base)
 
-        # ─── Section 1: No lintable files changed ───
-        t.section("No lintable files changed")
+        # Every section's env is derived from one of these two bases
+        env = dict(os.environ, PATH=path_with_lint)
+        env_no_lint = dict(os.environ, PATH=path_without_lint)
+
+        # ── Setup: one repo per section; each run below only reads its own
+        # repo and writes its own log, so the runs are independent ──
 
+        # No lintable files changed
         repo_none = os.path.join(temp_base, "repo-none")
         os.makedirs(repo_none)
         setup_git_repo(repo_none)
         write_file(repo_none, "README.md", "readme\n")
         _git(repo_none, "add", "README.md")
 
-        env = dict(os.environ, PATH=path_with_lint)
-        exit_code, output = run_script_combined(
-            LINT_CHANGED, "staged", repo_none, "", env=env)
-
-        t.assert_exit_code("exits 0 when no lintable files", exit_code, 0)
-        t.assert_contains("reports no lintable files", output,
-                          "No lintable files changed")
-
-        # ─── Section 2: JS/TS files (regression) ───
-        t.section("JS/TS linting (regression)")
-
+        # JS/TS files
         repo_js = os.path.join(temp_base, "repo-js")
         os.makedirs(repo_js)
         setup_git_repo(repo_js)
@@ -123,9 +132,111 @@ def run_tests():
         write_file(repo_js, "index.js", "console.log('hi')\n")
         _git(repo_js, "add", "index.js")
 
-        exit_code, output = run_script_combined(
-            LINT_CHANGED, "staged", repo_js, "npm run lint", env=env)
+        # Go staged with golangci-lint
+        repo_go_staged = _copy_repo(go_template, temp_base, "repo-go-staged")
+        write_files(repo_go_staged, {
+            "main.go": "package main\n",
+            "util.go": "package util\n",
+        })
+        _git(repo_go_staged, "add", "main.go", "util.go")
+
+        golangci_log = write_file(temp_base, "golangci-staged.log", "")
+        env_go = dict(env, GOLANGCI_LOG=golangci_log)
+
+        # Go branch with golangci-lint
+        repo_go_branch = _copy_repo(go_template, temp_base, "repo-go-branch")
+        _git(repo_go_branch, "checkout", "-q", "-b", "feature")
+        write_file(repo_go_branch, "main.go", "package main\n")
+        _git(repo_go_branch, "add", "main.go")
+        _git(repo_go_branch, "commit", "-q", "-m", "add main.go")
+
+        golangci_log_branch = write_file(temp_base, "golangci-branch.log", "")
+        env_branch = dict(env, GOLANGCI_LOG=golangci_log_branch)
+
+        # Go fallback when no golangci-lint
+        repo_go_fallback = _copy_repo(go_template, temp_base, "repo-go-fallback")
+        write_file(repo_go_fallback, "main.go", "package main\n")
+        _git(repo_go_fallback, "add", "main.go")
+
+        # Go no linter, no fallback
+        repo_go_skip = _copy_repo(go_template, temp_base, "repo-go-skip")
+        write_file(repo_go_skip, "main.go", "package main\n")
+        _git(repo_go_skip, "add", "main.go")
+
+        # Go lint failure
+        repo_go_fail = _copy_repo(go_template, temp_base, "repo-go-fail")
+        write_file(repo_go_fail, "main.go", "package main\n")
+        _git(repo_go_fail, "add", "main.go")
+
+        path_with_fail = fail_bin + ":" + path_without_lint
+        env_fail = dict(env_no_lint, PATH=path_with_fail)
+
+        # Mixed JS + Go project
+        repo_mixed = os.path.join(temp_base, "repo-mixed")
+        os.makedirs(repo_mixed)
+        setup_git_repo(repo_mixed)
+        write_files(repo_mixed, {
+            "eslint.config.js": "{}\n",
+            "go.mod": "module example.com/test\n",
+        })
+        _git(repo_mixed, "add", "eslint.config.js", "go.mod")
+        _git(repo_mixed, "commit", "-q", "-m", "setup")
+        write_files(repo_mixed, {
+            "index.js": "console.log('hi')\n",
+            "main.go": "package main\n",
+        })
+        _git(repo_mixed, "add", "index.js", "main.go")
+
+        # Only non-lintable files (.py)
+        repo_py = os.path.join(temp_base, "repo-py")
+        os.makedirs(repo_py)
+        setup_git_repo(repo_py)
+        write_file(repo_py, "script.py", 'print("hi")\n')
+        _git(repo_py, "add", "script.py")
+
+        # golangci-lint config detection
+        repo_go_config = os.path.join(temp_base, "repo-go-config")
+        os.makedirs(repo_go_config)
+        setup_git_repo(repo_go_config)
+        write_files(repo_go_config, {
+            "go.mod": "module example.com/test\n",
+            ".golangci.yml": "linters:\n",
+        })
+        _git(repo_go_config, "add", "go.mod", ".golangci.yml")
+        _git(repo_go_config, "commit", "-q", "-m", "setup")
+        write_file(repo_go_config, "main.go", "package main\n")
+        _git(repo_go_config, "add", "main.go")
+
+        golangci_log_config = write_file(temp_base, "golangci-config.log", "")
+        env_config = dict(env, GOLANGCI_LOG=golangci_log_config)
+
+        # ── Run lint-changed.sh for every section at once ──
+        results = run_script_each(LINT_CHANGED, {
+            "none": (["staged", repo_none, ""], env),
+            "js": (["staged", repo_js, "npm run lint"], env),
+            "go_staged": (["staged", repo_go_staged, "go vet ./..."], env_go),
+            "go_branch": (["HEAD~1", repo_go_branch, "go vet ./..."], env_branch),
+            "go_fallback": (["staged", repo_go_fallback, "echo FALLBACK_RAN"],
+                            env_no_lint),
+            "go_skip": (["staged", repo_go_skip, ""], env_no_lint),
+            "go_fail": (["staged", repo_go_fail, ""], env_fail),
+            "mixed": (["staged", repo_mixed, ""], env),
+            "py": (["staged", repo_py, ""], env),
+            "go_config": (["staged", repo_go_config, "go vet ./..."], env_config),
+        }, combined=True)
 
+        # ─── Section 1: No lintable files changed ───
+        t.section("No lintable files changed")
+
+        exit_code, output = results["none"]
+        t.assert_exit_code("exits 0 when no lintable files", exit_code, 0)
+        t.assert_contains("reports no lintable files", output,
+                          "No lintable files changed")
+
+        # ─── Section 2: JS/TS files (regression) ───
+        t.section("JS/TS linting (regression)")
+
+        exit_code, output = results["js"]
         t.assert_exit_code("exits 0 for JS lint pass", exit_code, 0)
         t.assert_contains("reports linting JS files", output, "changed file(s)")
         t.assert_contains("lists index.js", output, "index.js")
@@ -133,29 +244,12 @@ def run_tests():
         # ─── Section 3: Go staged with golangci-lint ───
         t.section("Go staged linting with golangci-lint")
 
-        repo_go_staged = os.path.join(temp_base, "repo-go-staged")
-        os.makedirs(repo_go_staged)
-        setup_git_repo(repo_go_staged)
-        write_file(repo_go_staged, "go.mod", "module example.com/test\n")
-        _git(repo_go_staged, "add", "go.mod")
-        _git(repo_go_staged, "commit", "-q", "-m", "add go.mod")
-        write_file(repo_go_staged, "main.go", "package main\n")
-        write_file(repo_go_staged, "util.go", "package util\n")
-        _git(repo_go_staged, "add", "main.go", "util.go")
-
-        golangci_log = os.path.join(temp_base, "golangci-staged.log")
-        write_file(temp_base, "golangci-staged.log", "")
-        env_go = dict(os.environ, PATH=path_with_lint, GOLANGCI_LOG=golangci_log)
-
-        exit_code, output = run_script_combined(
-            LINT_CHANGED, "staged", repo_go_staged, "go vet ./...", env=env_go)
-
+        exit_code, output = results["go_staged"]
         t.assert_exit_code("exits 0 for Go staged lint pass", exit_code, 0)
         t.assert_contains("reports linting Go files", output, "changed file(s)")
         t.assert_contains("lists main.go", output, "main.go")
 
-        with open(golangci_log) as f:
-            golangci_call = f.read()
+        golangci_call = _read(golangci_log)
         t.assert_contains("golangci-lint called with 'run'",
                           golangci_call, "run")
         t.assert_not_contains(
@@ -165,68 +259,24 @@ def run_tests():
         # ─── Section 4: Go branch with golangci-lint ───
         t.section("Go branch linting with golangci-lint")
 
-        repo_go_branch = os.path.join(temp_base, "repo-go-branch")
-        os.makedirs(repo_go_branch)
-        setup_git_repo(repo_go_branch)
-        write_file(repo_go_branch, "go.mod", "module example.com/test\n")
-        _git(repo_go_branch, "add", "go.mod")
-        _git(repo_go_branch, "commit", "-q", "-m", "add go.mod")
-        _git(repo_go_branch, "checkout", "-q", "-b", "feature")
-        write_file(repo_go_branch, "main.go", "package main\n")
-        _git(repo_go_branch, "add", "main.go")
-        _git(repo_go_branch, "commit", "-q", "-m", "add main.go")
-
-        golangci_log_branch = os.path.join(temp_base, "golangci-branch.log")
-        write_file(temp_base, "golangci-branch.log", "")
-        env_branch = dict(os.environ, PATH=path_with_lint,
-                          GOLANGCI_LOG=golangci_log_branch)
-
-        exit_code, output = run_script_combined(
-            LINT_CHANGED, "HEAD~1", repo_go_branch, "go vet ./...",
-            env=env_branch)
-
+        exit_code, output = results["go_branch"]
         t.assert_exit_code("exits 0 for Go branch lint pass", exit_code, 0)
 
-        with open(golangci_log_branch) as f:
-            golangci_call = f.read()
+        golangci_call = _read(golangci_log_branch)
         t.assert_contains("golangci-lint uses --new-from-rev for branch scope",
                           golangci_call, "--new-from-rev")
 
         # ─── Section 5: Go fallback when no golangci-lint ───
         t.section("Go linting fallback (no golangci-lint)")
 
-        repo_go_fallback = os.path.join(temp_base, "repo-go-fallback")
-        os.makedirs(repo_go_fallback)
-        setup_git_repo(repo_go_fallback)
-        write_file(repo_go_fallback, "go.mod", "module example.com/test\n")
-        _git(repo_go_fallback, "add", "go.mod")
-        _git(repo_go_fallback, "commit", "-q", "-m", "add go.mod")
-        write_file(repo_go_fallback, "main.go", "package main\n")
-        _git(repo_go_fallback, "add", "main.go")
-
-        env_no_lint = dict(os.environ, PATH=path_without_lint)
-        exit_code, output = run_script_combined(
-            LINT_CHANGED, "staged", repo_go_fallback, "echo FALLBACK_RAN",
-            env=env_no_lint)
-
+        exit_code, output = results["go_fallback"]
         t.assert_exit_code("exits 0 with fallback command", exit_code, 0)
         t.assert_contains("runs fallback command", output, "FALLBACK_RAN")
 
         # ─── Section 6: Go no linter, no fallback ───
         t.section("Go linting skipped (no linter, no fallback)")
 
-        repo_go_skip = os.path.join(temp_base, "repo-go-skip")
-        os.makedirs(repo_go_skip)
-        setup_git_repo(repo_go_skip)
-        write_file(repo_go_skip, "go.mod", "module example.com/test\n")
-        _git(repo_go_skip, "add", "go.mod")
-        _git(repo_go_skip, "commit", "-q", "-m", "add go.mod")
-        write_file(repo_go_skip, "main.go", "package main\n")
-        _git(repo_go_skip, "add", "main.go")
-
-        exit_code, output = run_script_combined(
-            LINT_CHANGED, "staged", repo_go_skip, "", env=env_no_lint)
-
+        exit_code, output = results["go_skip"]
         t.assert_exit_code("exits 0 when no linter available", exit_code, 0)
         t.assert_contains("reports no linter detected", output,
                           "No linter detected")
@@ -234,40 +284,14 @@ def run_tests():
         # ─── Section 7: Go lint failure propagates exit code ───
         t.section("Go lint failure exit code")
 
-        repo_go_fail = os.path.join(temp_base, "repo-go-fail")
-        os.makedirs(repo_go_fail)
-        setup_git_repo(repo_go_fail)
-        write_file(repo_go_fail, "go.mod", "module example.com/test\n")
-        _git(repo_go_fail, "add", "go.mod")
-        _git(repo_go_fail, "commit", "-q", "-m", "add go.mod")
-        write_file(repo_go_fail, "main.go", "package main\n")
-        _git(repo_go_fail, "add", "main.go")
-
-        path_with_fail = fail_bin + ":" + path_without_lint
-        env_fail = dict(os.environ, PATH=path_with_fail)
-        exit_code, output = run_script_combined(
-            LINT_CHANGED, "staged", repo_go_fail, "", env=env_fail)
-
+        exit_code, output = results["go_fail"]
         t.assert_exit_code("exits 1 when Go lint fails", exit_code, 1)
         t.assert_contains("reports lint FAILED", output, "RESULT: lint FAILED")
 
         # ─── Section 8: Mixed JS + Go project ───
         t.section("Mixed JS + Go project")
 
-        repo_mixed = os.path.join(temp_base, "repo-mixed")
-        os.makedirs(repo_mixed)
-        setup_git_repo(repo_mixed)
-        write_file(repo_mixed, "eslint.config.js", "{}\n")
-        write_file(repo_mixed, "go.mod", "module example.com/test\n")
-        _git(repo_mixed, "add", "eslint.config.js", "go.mod")
-        _git(repo_mixed, "commit", "-q", "-m", "setup")
-        write_file(repo_mixed, "index.js", "console.log('hi')\n")
-        write_file(repo_mixed, "main.go", "package main\n")
-        _git(repo_mixed, "add", "index.js", "main.go")
-
-        exit_code, output = run_script_combined(
-            LINT_CHANGED, "staged", repo_mixed, "", env=env)
-
+        exit_code, output = results["mixed"]
         t.assert_exit_code("exits 0 for mixed project lint pass", exit_code, 0)
         t.assert_contains("lists index.js in output", output, "index.js")
         t.assert_contains("lists main.go in output", output, "main.go")
@@ -275,15 +299,7 @@ def run_tests():
         # ─── Section 9: Only non-lintable files (.py) ───
         t.section("Only .py files changed (not lintable)")
 
-        repo_py = os.path.join(temp_base, "repo-py")
-        os.makedirs(repo_py)
-        setup_git_repo(repo_py)
-        write_file(repo_py, "script.py", 'print("hi")\n')
-        _git(repo_py, "add", "script.py")
-
-        exit_code, output = run_script_combined(
-            LINT_CHANGED, "staged", repo_py, "", env=env)
-
+        exit_code, output = results["py"]
         t.assert_exit_code("exits 0 when only .py files changed", exit_code, 0)
         t.assert_contains("reports no lintable files", output,
                           "No lintable files changed")
@@ -291,25 +307,7 @@ def run_tests():
         # ─── Section 10: golangci-lint config detection ───
         t.section("golangci-lint config detection")
 
-        repo_go_config = os.path.join(temp_base, "repo-go-config")
-        os.makedirs(repo_go_config)
-        setup_git_repo(repo_go_config)
-        write_file(repo_go_config, "go.mod", "module example.com/test\n")
-        write_file(repo_go_config, ".golangci.yml", "linters:\n")
-        _git(repo_go_config, "add", "go.mod", ".golangci.yml")
-        _git(repo_go_config, "commit", "-q", "-m", "setup")
-        write_file(repo_go_config, "main.go", "package main\n")
-        _git(repo_go_config, "add", "main.go")
-
-        golangci_log_config = os.path.join(temp_base, "golangci-config.log")
-        write_file(temp_base, "golangci-config.log", "")
-        env_config = dict(os.environ, PATH=path_with_lint,
-                          GOLANGCI_LOG=golangci_log_config)
-
-        exit_code, output = run_script_combined(
-            LINT_CHANGED, "staged", repo_go_config, "go vet ./...",
-            env=env_config)
-
+        exit_code, output = results["go_config"]
         t.assert_exit_code("exits 0 with golangci-lint config present",
                            exit_code, 0)
 
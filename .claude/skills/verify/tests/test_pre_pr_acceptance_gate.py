@@ -19,7 +19,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from test_harness import (
     TestResults, hook_path, make_hook_input, TempDir, setup_git_repo,
-    write_file, make_executable,
+    write_file, write_executable,
 )
 
 HOOK = hook_path("pre-pr-hook.sh")
@@ -345,9 +345,8 @@ def run_tests():
         # Create a fake npx that prints its arguments so we can verify injection
         bin_dir = os.path.join(temp_dir, "fake-bin")
         os.makedirs(bin_dir)
-        write_file(temp_dir, "fake-bin/npx",
-                   "#!/bin/bash\necho \"npx-args: $@\"\n")
-        make_executable(os.path.join(temp_dir, "fake-bin", "npx"))
+        write_executable(temp_dir, "fake-bin/npx",
+                         "#!/bin/bash\necho \"npx-args: $@\"\n")
 
         os.makedirs(os.path.join(temp_dir, ".claude"), exist_ok=True)
         write_file(temp_dir, ".claude/verify.json", json.dumps({
@@ -401,9 +400,8 @@ def run_tests():
         # Create fake npx to capture args
         bin_dir = os.path.join(temp_dir, "fake-bin")
         os.makedirs(bin_dir)
-        write_file(temp_dir, "fake-bin/npx",
-                   "#!/bin/bash\necho \"npx-args: $@\"\n")
-        make_executable(os.path.join(temp_dir, "fake-bin", "npx"))
+        write_executable(temp_dir, "fake-bin/npx",
+                         "#!/bin/bash\necho \"npx-args: $@\"\n")
 
         os.makedirs(os.path.join(temp_dir, ".claude"), exist_ok=True)
         write_file(temp_dir, ".claude/verify.json", json.dumps({
@@ -19,7 +19,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from test_harness import (
     TestResults, hook_path, script_path, run_script, make_hook_input, TempDir,
-    setup_git_repo, write_file, make_executable,
+    setup_git_repo, write_file, write_executable,
 )
 
 HOOK = hook_path("pre-pr-hook.sh")
@@ -155,9 +155,8 @@ def run_tests():
         bin_dir = os.path.join(temp_dir, "fake-bin")
         os.makedirs(bin_dir)
         gh_log = os.path.join(temp_dir, "gh-call.log")
-        write_file(temp_dir, "fake-bin/gh",
-                   f'#!/bin/bash\necho "gh-called: $@" > "{gh_log}"\necho "gh-args: $@"\n')
-        make_executable(os.path.join(temp_dir, "fake-bin", "gh"))
+        write_executable(temp_dir, "fake-bin/gh",
+                         f'#!/bin/bash\necho "gh-called: $@" > "{gh_log}"\necho "gh-args: $@"\n')
 
         os.makedirs(os.path.join(temp_dir, ".claude"), exist_ok=True)
         write_file(temp_dir, ".claude/verify.json", json.dumps({
@@ -256,9 +255,8 @@ def run_tests():
         # Create fake gh that fails on workflow run
         bin_dir = os.path.join(temp_dir, "fake-bin")
         os.makedirs(bin_dir)
-        write_file(temp_dir, "fake-bin/gh",
-                   '#!/bin/bash\nif [[ "$1" == "workflow" ]]; then echo "could not create workflow dispatch event" >&2; exit 1; fi\necho "gh: $@"\n')
-        make_executable(os.path.join(temp_dir, "fake-bin", "gh"))
+        write_executable(temp_dir, "fake-bin/gh",
+                         '#!/bin/bash\nif [[ "$1" == "workflow" ]]; then echo "could not create workflow dispatch event" >&2; exit 1; fi\necho "gh: $@"\n')
 
         os.makedirs(os.path.join(temp_dir, ".claude"), exist_ok=True)
         write_file(temp_dir, ".claude/verify.json", json.dumps({
@@ -326,9 +324,8 @@ def run_tests():
         bin_dir = os.path.join(temp_dir, "fake-bin")
         os.makedirs(bin_dir)
         gh_log = os.path.join(temp_dir, "gh-args.log")
-        write_file(temp_dir, "fake-bin/gh",
-                   f'#!/bin/bash\necho "$@" >> "{gh_log}"\n')
-        make_executable(os.path.join(temp_dir, "fake-bin", "gh"))
+        write_executable(temp_dir, "fake-bin/gh",
+                         f'#!/bin/bash\necho "$@" >> "{gh_log}"\n')
 
         os.makedirs(os.path.join(temp_dir, ".claude"), exist_ok=True)
         write_file(temp_dir, ".claude/verify.json", json.dumps({
@@ -373,9 +370,8 @@ def run_tests():
         bin_dir = os.path.join(temp_dir, "fake-bin")
         os.makedirs(bin_dir)
         gh_log = os.path.join(temp_dir, "gh-calls.log")
-        write_file(temp_dir, "fake-bin/gh",
-                   f'#!/bin/bash\necho "$@" >> "{gh_log}"\n')
-        make_executable(os.path.join(temp_dir, "fake-bin", "gh"))
+        write_executable(temp_dir, "fake-bin/gh",
+                         f'#!/bin/bash\necho "$@" >> "{gh_log}"\n')
 
         os.makedirs(os.path.join(temp_dir, ".claude"), exist_ok=True)
         write_file(temp_dir, ".claude/verify.json", json.dumps({
@@ -418,14 +414,12 @@ def run_tests():
         # Create fake gh that fails on workflow run
         bin_dir = os.path.join(temp_dir, "fake-bin")
         os.makedirs(bin_dir)
-        write_file(temp_dir, "fake-bin/gh",
-                   '#!/bin/bash\nif [[ "$1" == "workflow" ]]; then exit 1; fi\necho "gh: $@"\n')
-        make_executable(os.path.join(temp_dir, "fake-bin", "gh"))
+        write_executable(temp_dir, "fake-bin/gh",
+                         '#!/bin/bash\nif [[ "$1" == "workflow" ]]; then exit 1; fi\necho "gh: $@"\n')
 
         # Create fake npx that prints its args
-        write_file(temp_dir, "fake-bin/npx",
-                   "#!/bin/bash\necho \"npx-args: $@\"\n")
-        make_executable(os.path.join(temp_dir, "fake-bin", "npx"))
+        write_executable(temp_dir, "fake-bin/npx",
+                         "#!/bin/bash\necho \"npx-args: $@\"\n")
 
         os.makedirs(os.path.join(temp_dir, ".claude"), exist_ok=True)
         write_file(temp_dir, ".claude/verify.json", json.dumps({
@@ -457,9 +451,8 @@ def run_tests():
         # Create fake gh that fails on workflow run
         bin_dir = os.path.join(temp_dir, "fake-bin")
         os.makedirs(bin_dir)
-        write_file(temp_dir, "fake-bin/gh",
-                   '#!/bin/bash\nif [[ "$1" == "workflow" ]]; then exit 1; fi\necho "gh: $@"\n')
-        make_executable(os.path.join(temp_dir, "fake-bin", "gh"))
+        write_executable(temp_dir, "fake-bin/gh",
+                         '#!/bin/bash\nif [[ "$1" == "workflow" ]]; then exit 1; fi\necho "gh: $@"\n')
 
         os.makedirs(os.path.join(temp_dir, ".claude"), exist_ok=True)
         # Only acceptance_test_ci, no acceptance_test
@@ -497,9 +490,8 @@ def run_tests():
 
         bin_dir = os.path.join(temp_dir, "fake-bin")
         os.makedirs(bin_dir)
-        write_file(temp_dir, "fake-bin/gh",
-                   '#!/bin/bash\necho "ok"\n')
-        make_executable(os.path.join(temp_dir, "fake-bin", "gh"))
+        write_executable(temp_dir, "fake-bin/gh",
+                         '#!/bin/bash\necho "ok"\n')
 
         os.makedirs(os.path.join(temp_dir, ".claude"), exist_ok=True)
         write_file(temp_dir, ".claude/verify.json", json.dumps({
@@ -8,15 +8,17 @@ Exercises the hook with:
 - CodeRabbit CLI review integration (advisory, skip with .skip-coderabbit)
 """
 
+import functools
 import json
 import os
+import shutil
 import subprocess
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from test_harness import (
-    TestResults, hook_path, make_hook_input, TempDir, setup_git_repo,
-    write_file, make_executable,
+    TestResults, hook_path, make_hook_input, run_hooks, TempDir, setup_git_repo,
+    write_file, write_executable,
 )
 
 HOOK = hook_path("pre-push-hook.sh")
@@ -29,17 +31,15 @@ def create_mock_gh(temp_dir, pr_response="[]"):
     """
     bin_dir = os.path.join(temp_dir, "mock-bin")
     os.makedirs(bin_dir, exist_ok=True)
-    gh_script = os.path.join(bin_dir, "gh")
-    write_file(temp_dir, "mock-bin/gh", f"""#!/usr/bin/env bash
+    write_executable(temp_dir, "mock-bin/gh", f"""#!/usr/bin/env bash
 # Mock gh CLI for testing PR detection
-if echo "$@" | grep -q "pr list"; then
+if [[ "$*" == *"pr list"* ]]; then
     echo '{pr_response}'
     exit 0
 fi
 # Unknown command — pass through
 exit 0
 """)
-    make_executable(gh_script)
     return bin_dir
 
 
@@ -49,20 +49,15 @@ def create_mock_coderabbit(bin_dir, output="No issues found.", exit_code=0):
     Uses a separate file for output to avoid shell-quote injection issues.
     Adds a 'coderabbit' script to bin_dir that returns fixed output for 'review' calls.
     """
-    output_file = os.path.join(bin_dir, "coderabbit-output.txt")
-    with open(output_file, "w") as f:
-        f.write(output)
-    cr_script = os.path.join(bin_dir, "coderabbit")
-    with open(cr_script, "w") as f:
-        f.write(f"""#!/usr/bin/env bash
+    output_file = write_file(bin_dir, "coderabbit-output.txt", output)
+    write_executable(bin_dir, "coderabbit", f"""#!/usr/bin/env bash
 # Mock coderabbit CLI for testing
-if echo "$@" | grep -q "review"; then
+if [[ "$*" == *"review"* ]]; then
     cat "{output_file}"
     exit {exit_code}
 fi
 exit 0
 """)
-    make_executable(cr_script)
 
 
 def run_hook_with_env(hook, json_input, extra_path=None):
@@ -96,10 +91,11 @@ def setup_repo_with_branch(temp_dir, branch_name="feature/test",
     setup_git_repo(temp_dir, branch="main")
 
     if with_remote:
-        # Create a bare repo as the remote
+        # Create an empty bare repo as the remote and push main into it;
+        # the push also writes origin/main, so no clone or fetch is needed
         bare_dir = os.path.join(temp_dir, ".bare-remote")
         subprocess.run(
-            ["git", "clone", "--bare", "--quiet", temp_dir, bare_dir],
+            ["git", "init", "--bare", "--quiet", "--template=", bare_dir],
             capture_output=True, check=True,
         )
         subprocess.run(
@@ -107,7 +103,7 @@ def setup_repo_with_branch(temp_dir, branch_name="feature/test",
             cwd=temp_dir, capture_output=True, check=True,
         )
         subprocess.run(
-            ["git", "fetch", "origin", "--quiet"],
+            ["git", "push", "--quiet", "origin", "main"],
             cwd=temp_dir, capture_output=True, check=True,
         )
 
@@ -128,6 +124,34 @@ def setup_repo_with_branch(temp_dir, branch_name="feature/test",
     return temp_dir
 
 
+@functools.lru_cache(maxsize=None)
+def _template_repo(with_remote=False):
+    """Return a setup_repo_with_branch() repo built once per process.
+
+    Sections copy it with _copy_template() rather than rebuilding it;
+    removed when the process exits.
+    """
+    with TempDir(cleanup="atexit") as path:
+        return setup_repo_with_branch(path, with_remote=with_remote)
+
+
+def _copy_template(temp_dir, with_remote=False):
+    """Copy the cached feature-branch repo into temp_dir.
+
+    The bare remote lives inside the repo, so origin is repointed at the
+    copy's own .bare-remote by rewriting .git/config.
+    """
+    template = _template_repo(with_remote)
+    shutil.copytree(template, temp_dir, symlinks=True, dirs_exist_ok=True)
+    if with_remote:
+        config = os.path.join(temp_dir, ".git", "config")
+        with open(config) as f:
+            text = f.read()
+        with open(config, "w") as f:
+            f.write(text.replace(template, temp_dir))
+    return temp_dir
+
+
 def run_tests():
     t = TestResults("pre-push-hook.sh tests")
     t.header()
@@ -138,35 +162,26 @@ def run_tests():
     with TempDir() as temp_dir:
         setup_git_repo(temp_dir)
 
-        exit_code, output = run_hook_with_env(
-            HOOK, make_hook_input("git status", temp_dir))
-        if exit_code == 0 and output.strip() == "":
-            t._pass("git status passes through silently")
-        else:
-            t._fail("git status passes through silently",
-                     f"exit={exit_code}, output={output}")
-
-        exit_code, output = run_hook_with_env(
-            HOOK, make_hook_input("npm test", temp_dir))
-        if exit_code == 0 and output.strip() == "":
-            t._pass("npm test passes through silently")
-        else:
-            t._fail("npm test passes through silently",
-                     f"exit={exit_code}, output={output}")
-
-        exit_code, output = run_hook_with_env(
-            HOOK, make_hook_input("git commit -m 'test'", temp_dir))
-        if exit_code == 0 and output.strip() == "":
-            t._pass("git commit passes through silently")
-        else:
-            t._fail("git commit passes through silently",
-                     f"exit={exit_code}, output={output}")
+        # (label, command) pairs; the hook calls are independent
+        cases = [
+            ("git status", "git status"),
+            ("npm test", "npm test"),
+            ("git commit", "git commit -m 'test'"),
+        ]
+        results = run_hooks(
+            [(HOOK, make_hook_input(cmd, temp_dir)) for _, cmd in cases])
+        for (label, _), (exit_code, output) in zip(cases, results):
+            name = f"{label} passes through silently"
+            if exit_code == 0 and output.strip() == "":
+                t._pass(name)
+            else:
+                t._fail(name, f"exit={exit_code}, output={output}")
 
     # ─── Section 2: Push with no open PR (standard security only) ───
     t.section("Push with no open PR (standard security only)")
 
     with TempDir() as temp_dir:
-        setup_repo_with_branch(temp_dir)
+        _copy_template(temp_dir)
         mock_bin = create_mock_gh(temp_dir, pr_response="[]")
 
         exit_code, output = run_hook_with_env(
@@ -190,7 +205,7 @@ def run_tests():
     t.section("Push with open PR (expanded security + tests)")
 
     with TempDir() as temp_dir:
-        setup_repo_with_branch(temp_dir)
+        _copy_template(temp_dir)
         mock_bin = create_mock_gh(temp_dir, pr_response='[{"number": 42}]')
 
         exit_code, output = run_hook_with_env(
@@ -214,13 +229,11 @@ def run_tests():
     t.section("gh unavailable (fallback to standard security)")
 
     with TempDir() as temp_dir:
-        setup_repo_with_branch(temp_dir)
+        _copy_template(temp_dir)
         # Create a mock gh that fails (simulates gh not authenticated or unavailable)
         mock_bin = os.path.join(temp_dir, "broken-gh-bin")
         os.makedirs(mock_bin, exist_ok=True)
-        broken_gh = os.path.join(mock_bin, "gh")
-        write_file(temp_dir, "broken-gh-bin/gh", "#!/usr/bin/env bash\nexit 1\n")
-        make_executable(broken_gh)
+        write_executable(temp_dir, "broken-gh-bin/gh", "#!/usr/bin/env bash\nexit 1\n")
 
         exit_code, output = run_hook_with_env(
             HOOK, make_hook_input("git push origin feature/test", temp_dir),
@@ -242,7 +255,7 @@ def run_tests():
     t.section("Push command detection patterns")
 
     with TempDir() as temp_dir:
-        setup_repo_with_branch(temp_dir)
+        _copy_template(temp_dir)
         mock_bin = create_mock_gh(temp_dir, pr_response="[]")
 
         # Chained push command
@@ -273,7 +286,7 @@ def run_tests():
     t.section("CodeRabbit CLI review (advisory)")
 
     with TempDir() as temp_dir:
-        setup_repo_with_branch(temp_dir, with_remote=True)
+        _copy_template(temp_dir, with_remote=True)
         mock_bin = create_mock_gh(temp_dir, pr_response="[]")
         create_mock_coderabbit(mock_bin,
                                output="File: src/app.ts\nLine: 42\nType: potential_issue\n\nComment:\nMissing error handling in src/app.ts:42")
@@ -307,7 +320,7 @@ def run_tests():
     t.section("CodeRabbit CLI review clean output (no findings in additionalContext)")
 
     with TempDir() as temp_dir:
-        setup_repo_with_branch(temp_dir, with_remote=True)
+        _copy_template(temp_dir, with_remote=True)
         mock_bin = create_mock_gh(temp_dir, pr_response="[]")
         # Mock returns only status text, no actual findings
         create_mock_coderabbit(mock_bin, output="No issues found.")
@@ -341,7 +354,7 @@ def run_tests():
     t.section("CodeRabbit CLI review skipped with .skip-coderabbit")
 
     with TempDir() as temp_dir:
-        setup_repo_with_branch(temp_dir, with_remote=True)
+        _copy_template(temp_dir, with_remote=True)
         mock_bin = create_mock_gh(temp_dir, pr_response="[]")
         create_mock_coderabbit(mock_bin,
                                output="Issue: This should not appear")
@@ -368,7 +381,7 @@ def run_tests():
     t.section("CodeRabbit CLI review skipped on security failure")
 
     with TempDir() as temp_dir:
-        setup_repo_with_branch(temp_dir, with_remote=True)
+        _copy_template(temp_dir, with_remote=True)
         mock_bin = create_mock_gh(temp_dir, pr_response="[]")
         create_mock_coderabbit(mock_bin,
                                output="Issue: This should not appear")
@@ -0,0 +1,104 @@
+# ABOUTME: Tests for the run_tests.py runner itself
+# ABOUTME: Verifies a module that raises mid-section still reports its buffered results
+"""Tests for run_tests.py and TestResults output on a crash.
+
+Runs each case in a fresh interpreter, so the crashing module's output
+never mixes with this suite's own buffer:
+- run_module() on a module that fails an assertion and then raises
+- The same module run directly, without the runner
+"""
+
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_harness import TestResults, TempDir, write_file
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CRASHING_MODULE = """\
+from test_harness import TestResults
+
+
+def run_tests():
+    t = TestResults("boom")
+    t.header()
+    t.section("one")
+    t.assert_equal("one equals one", 1, 1)
+    t.assert_equal("one equals two", 1, 2)
+    raise RuntimeError("kaboom")
+"""
+
+
+def _run_module(module_dir, module_name):
+    """Call run_tests.run_module() in a subprocess; returns (result, output)."""
+    code = (
+        "import run_tests\n"
+        f"name, passed, failed, count, output = run_tests.run_module({module_name!r})\n"
+        "print(passed, failed, count)\n"
+        "print(output, end='')\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=TESTS_DIR, capture_output=True, text=True,
+        env=dict(os.environ, PYTHONPATH=module_dir),
+    )
+    counts, _, output = result.stdout.partition("\n")
+    return counts, output
+
+
+def _run_direct(module_dir, module_name):
+    """Import the module and call its run_tests() with no runner; returns stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import {module_name}; {module_name}.run_tests()"],
+        capture_output=True, text=True,
+        env=dict(os.environ, PYTHONPATH=f"{module_dir}:{TESTS_DIR}"),
+    )
+    return result.stdout
+
+
+def run_tests():
+    t = TestResults("run_tests.py tests")
+    t.header()
+
+    # ─── Section 1: Module raising mid-section ───
+    t.section("Module raising mid-section keeps its buffered output")
+
+    with TempDir() as temp_dir:
+        write_file(temp_dir, "test_boom.py", CRASHING_MODULE)
+        counts, output = _run_module(temp_dir, "test_boom")
+
+        t.assert_equal("crash counts as one failure", counts, "0 1 1")
+        t.assert_contains("section header is written", output, "--- one ---")
+        t.assert_contains("PASS before the raise is written", output,
+                          "one equals one")
+        t.assert_contains("FAIL before the raise is written", output,
+                          "one equals two")
+        t.assert_contains("FAIL details are written", output, "Expected: 2")
+        t.assert_contains("error is reported", output,
+                          "loading test_boom: kaboom")
+        t.assert_equal("results come before the error",
+                       output.find("one equals two") < output.find("kaboom"),
+                       True)
+
+    # ─── Section 2: Module raising when run directly ───
+    t.section("Module raising outside the runner keeps its buffered output")
+
+    with TempDir() as temp_dir:
+        write_file(temp_dir, "test_boom.py", CRASHING_MODULE)
+        output = _run_direct(temp_dir, "test_boom")
+
+        t.assert_contains("PASS before the raise is written", output,
+                          "one equals one")
+        t.assert_contains("FAIL before the raise is written", output,
+                          "one equals two")
+        t.assert_contains("FAIL details are written", output, "Expected: 2")
+
+    t.summary()
+    return t.passed, t.failed, t.total
+
+
+if __name__ == "__main__":
+    passed, failed, total = run_tests()
+    sys.exit(0 if failed == 0 else 1)
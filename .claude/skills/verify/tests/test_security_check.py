@@ -27,10 +27,10 @@ SECURITY_CHECK = script_path("security-check.sh")
 
 
 def _git(repo, *args):
-    """Run a git command in a repo."""
+    """Run a git command in a repo; its output is not needed by any caller."""
     return subprocess.run(
         ["git"] + list(args),
-        cwd=repo, capture_output=True, text=True,
+        cwd=repo, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
     )
 
 
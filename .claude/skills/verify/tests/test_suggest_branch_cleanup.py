@@ -99,7 +99,7 @@ def run_tests():
     t.assert_equal("empty command exits 0", exit_code, 0)
     t.assert_equal("empty command produces no advisory", has_advisory(stdout), False)
 
-    return t.passed, t.failed, t.passed + t.failed
+    return t.results()
 
 
 if __name__ == "__main__":
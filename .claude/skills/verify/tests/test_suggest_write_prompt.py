@@ -62,7 +62,7 @@ def run_tests():
     t.assert_equal("empty path exits 0", exit_code, 0)
     t.assert_equal("empty path produces no output", stdout.strip(), "")
 
-    return t.passed, t.failed, t.passed + t.failed
+    return t.results()
 
 
 if __name__ == "__main__":
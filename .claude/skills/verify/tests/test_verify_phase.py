@@ -17,8 +17,7 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from test_harness import (
-    TestResults, script_path, run_script_combined, TempDir, write_file,
-    make_executable,
+    TestResults, script_path, run_script_combined, TempDir, write_executable,
 )
 
 VERIFY_PHASE = script_path("verify-phase.sh")
@@ -43,8 +42,7 @@ def create_test_command(temp_dir, name, stdout_lines, exit_code,
 {stdout_part}{stderr_part}
 exit {exit_code}
 """
-    script = write_file(temp_dir, name, content)
-    make_executable(script)
+    script = write_executable(temp_dir, name, content)
     return script
 
 
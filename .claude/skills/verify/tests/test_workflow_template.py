@@ -61,7 +61,7 @@ def run_tests():
 
     if not os.path.exists(TEMPLATE_PATH):
         t._fail("template file exists", f"Not found: {TEMPLATE_PATH}")
-        return t.passed, t.failed, t.total
+        return t.results()
 
     t._pass("template file exists")
 
@@ -71,13 +71,13 @@ def run_tests():
     data, err = _load_yaml()
     if err:
         t._fail(f"YAML parseable ({err})")
-        return t.passed, t.failed, t.total
+        return t.results()
 
     t._pass("YAML parseable")
 
     if not isinstance(data, dict):
         t._fail("YAML is a mapping")
-        return t.passed, t.failed, t.total
+        return t.results()
 
     t._pass("YAML is a mapping")
 
@@ -97,7 +97,7 @@ def run_tests():
     jobs = data.get("jobs", {})
     if not jobs:
         t._fail("at least one job defined")
-        return t.passed, t.failed, t.total
+        return t.results()
 
     t._pass("at least one job defined")
 
@@ -185,7 +185,7 @@ def run_tests():
         t._fail("has documentation comments",
                 f"Expected >= 5 comment lines, got {len(comment_lines)}")
 
-    return t.passed, t.failed, t.total
+    return t.results()
 
 
 if __name__ == "__main__":